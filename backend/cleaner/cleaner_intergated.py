@@ -4,7 +4,8 @@ Integrated Central Data Cleaner
 Combines brand detection, product cleaning, normalization, and inference
 """
 
-import json
+import orjson
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
@@ -26,7 +27,10 @@ class   IntegratedProductCleaner:
     6. Schema enforcement
     """
     
-    def __init__(self, brands_file: Optional[str] = None):
+    def __init__(self, brands_file: Optional[str] = None, workers: Optional[int] = None):
+        self.brands_file = brands_file
+        # Worker processes for process_batch; None or 1 keeps it in-process
+        self.workers = workers
         self.normalizer = NormalizationEngine()
         self.inferencer = EnhancedInferenceEngine()
         self.brand_detector = get_brand_detector(brands_file)
@@ -35,8 +39,7 @@ class   IntegratedProductCleaner:
     
     def load_raw_products(self, file_path: str) -> List[Dict[str, Any]]:
         """Load raw product data from JSON file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = orjson.loads(Path(file_path).read_bytes())
         
         # Handle both single object and array
         if isinstance(data, dict):
@@ -50,6 +53,13 @@ class   IntegratedProductCleaner:
         else:
             raise ValueError("Invalid JSON format: expected list or object")
     
+    def confirmed_brand(self, raw_product: Dict[str, Any]) -> Optional[str]:
+        """Normalized brand given by the source itself, if any"""
+        existing_brand = raw_product.get('brand') or raw_product.get('Brand')
+        if existing_brand and str(existing_brand).upper() not in ['N/A', 'NA', 'NONE', 'NULL']:
+            return self.normalizer.normalize_text(existing_brand)
+        return None
+    
     def clean_and_normalize_product(self, raw_product: Dict[str, Any]) -> Dict[str, Any]:
         """
         Stage 1: Clean product names, detect brands, normalize all fields
@@ -67,12 +77,11 @@ class   IntegratedProductCleaner:
             normalized['Product Name'] = cleaned_name
         
         # ===== BRAND DETECTION =====
-        existing_brand = raw_product.get('brand') or raw_product.get('Brand')
-        if existing_brand and str(existing_brand).upper() not in ['N/A', 'NA', 'NONE', 'NULL']:
-            normalized['Brand'] = self.normalizer.normalize_text(existing_brand)
+        brand = self.confirmed_brand(raw_product)
+        if brand:
+            normalized['Brand'] = brand
             # Learn this brand for future detection
-            if normalized['Brand']:
-                self.brand_detector.learn_brand(original_name, normalized['Brand'])
+            self.brand_detector.learn_brand(original_name, brand)
         else:
             # Detect brand from product name
             detected_brand = self.brand_detector.detect_brand(original_name)
@@ -323,9 +332,19 @@ class   IntegratedProductCleaner:
     def process_batch(self, raw_products: List[Dict[str, Any]], 
                      source_name: str, source_url: str) -> List[Dict[str, Any]]:
         """Process multiple products from a single source"""
+        if self.workers and self.workers > 1:
+            return self._process_batch_parallel(raw_products, source_name, source_url)
+        
         processed = []
         skipped = 0
         
+        # Clean every name in one vectorized pass up front; process_product
+        # then picks them up from the normalizer's cache
+        self.normalizer.clean_product_names([
+            raw_product.get('name') or raw_product.get('Product Name', '')
+            for raw_product in raw_products
+        ])
+        
         for raw_product in raw_products:
             try:
                 clean_product = self.process_product(raw_product, source_name, source_url)
@@ -343,6 +362,40 @@ class   IntegratedProductCleaner:
         
         return processed
     
+    def _process_batch_parallel(self, raw_products: List[Dict[str, Any]],
+                                source_name: str, source_url: str) -> List[Dict[str, Any]]:
+        """
+        process_batch across self.workers processes
+        Workers only detect brands; confirmed brands are learned here
+        afterwards so the brands file has a single writer
+        """
+        jobs = [(raw_product, source_name, source_url) for raw_product in raw_products]
+        
+        with ProcessPoolExecutor(max_workers=self.workers,
+                                 initializer=_init_worker,
+                                 initargs=(self.brands_file,)) as executor:
+            results = list(executor.map(_process_one, jobs, chunksize=256))
+        
+        processed = []
+        skipped = 0
+        
+        for raw_product, (clean_product, error) in zip(raw_products, results):
+            if error:
+                print(f"⚠️  Error processing product: {error}")
+            if clean_product:
+                processed.append(clean_product)
+                brand = self.confirmed_brand(raw_product)
+                if brand:
+                    original_name = raw_product.get('name') or raw_product.get('Product Name', '')
+                    self.brand_detector.learn_brand(original_name, brand)
+            else:
+                skipped += 1
+        
+        if skipped > 0:
+            print(f"⚠️  Skipped {skipped} products (null id/name or errors)")
+        
+        return processed
+    
     def process_file(self, input_file: str, source_name: str, 
                     source_url: str) -> List[Dict[str, Any]]:
         """
@@ -391,8 +444,7 @@ class   IntegratedProductCleaner:
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(products, f, indent=2, ensure_ascii=False)
+        output_path.write_bytes(orjson.dumps(products, option=orjson.OPT_INDENT_2))
         
         print(f"\n📄 Master JSON saved to: {output_path}")
         print(f"   Total products: {len(products)}")
@@ -452,10 +504,31 @@ class   IntegratedProductCleaner:
         print(f"Known Brands: {self.brand_detector.get_brand_count()}")
 
 
+# Per-process cleaner for IntegratedProductCleaner._process_batch_parallel
+_worker_cleaner: Optional[IntegratedProductCleaner] = None
+
+
+def _init_worker(brands_file: Optional[str]):
+    """Build the worker's cleaner once, so compiled state is reused"""
+    global _worker_cleaner
+    _worker_cleaner = IntegratedProductCleaner(brands_file)
+    # The parent process owns the brands file
+    _worker_cleaner.brand_detector.auto_save = False
+
+
+def _process_one(job):
+    """Process one (raw_product, source_name, source_url) job in a worker"""
+    try:
+        return _worker_cleaner.process_product(*job), None
+    except Exception as e:
+        return None, str(e)
+
+
 # Convenience function
 def clean_and_merge(source_configs: List[Dict[str, str]], 
                    output_file: str = 'master_products.json',
-                   brands_file: Optional[str] = None):
+                   brands_file: Optional[str] = None,
+                   workers: Optional[int] = None):
     """
     One-liner to clean and merge multiple data sources
     
@@ -465,7 +538,7 @@ def clean_and_merge(source_configs: List[Dict[str, str]],
             {'file': 'walmart.json', 'name': 'Walmart', 'url': 'https://walmart.com'}
         ])
     """
-    cleaner = IntegratedProductCleaner(brands_file)
+    cleaner = IntegratedProductCleaner(brands_file, workers)
     products = cleaner.merge_multiple_sources(source_configs)
     cleaner.save_master_json(products, output_file)
     return products
\ No newline at end of file
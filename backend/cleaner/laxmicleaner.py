@@ -1,25 +1,82 @@
 import re
 from typing import Dict, Optional, List, Tuple
 import json
+import orjson
+
+
+# Common nutritional patterns, fused into one alternation so the
+# description is scanned once instead of once per field
+_NUTRITION_PATTERNS = {
+    'energy': r'Energy[:\s]*(?P<energy_value>\d+(?:\.\d+)?)\s*(?P<energy_unit>kJ|kcal|cal)',
+    'fat': r'Fat[:\s]*(?P<fat_value>\d+(?:\.\d+)?)\s*g',
+    'saturates': r'(?:of which[:\s]*)?saturates[:\s]*(?P<saturates_value>\d+(?:\.\d+)?)\s*g',
+    'carbohydrate': r'Carbohydrate[:\s]*(?P<carbohydrate_value>\d+(?:\.\d+)?)\s*g',
+    'sugars': r'(?:of which[:\s]*)?sugars[:\s]*(?P<sugars_value>\d+(?:\.\d+)?)\s*g',
+    'fibre': r'Fibre[:\s]*(?P<fibre_value>\d+(?:\.\d+)?)\s*g',
+    'protein': r'Protein[:\s]*(?P<protein_value>\d+(?:\.\d+)?)\s*g',
+    'salt': r'Salt[:\s]*(?P<salt_value>\d+(?:\.\d+)?)\s*g',
+}
+
+_NUTRITION_RE = re.compile(
+    '|'.join(f'(?P<{key}>{pattern})' for key, pattern in _NUTRITION_PATTERNS.items()),
+    re.IGNORECASE
+)
+
+# Common allergens; matched case-insensitively so only the short matched
+# word is lowercased, not the whole description
+_ALLERGEN_RES = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\b(nuts?|peanuts?|tree nuts?)\b',
+        r'\b(milk|dairy|lactose)\b',
+        r'\b(soy|soya)\b',
+        r'\b(wheat|gluten)\b',
+        r'\b(eggs?)\b',
+        r'\b(fish)\b',
+        r'\b(shellfish|crustaceans?)\b',
+        r'\b(sesame)\b',
+        r'\b(mustard)\b',
+        r'\b(celery)\b',
+        r'\b(lupin)\b',
+        r'\b(sulphites?|sulfites?)\b',
+    )
+]
+
+_CERTIFICATION_RES = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\b(vegan|vegetarian|halal|kosher|organic|gluten[- ]free|dairy[- ]free|nut[- ]free)\b',
+    )
+]
+
+_MULTIPACK_SPLIT_RE = re.compile(r'\d+\s*[×xX]\s*\d+(?:\.\d+)?\s*(?:ml|g|l|kg|cl|oz)', re.IGNORECASE)
+
+
+_BRANDS_FILE = r"C:\Users\ankun\NewdjangoEnv\Product_scraping\backend\data\brands.json"
+
+
+def _load_brands(path: str) -> List[str]:
+    try:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return []
+    except orjson.JSONDecodeError:
+        return []
+
+
+# Loaded once at import and shared read-only by every BrandDetector,
+# so forked workers inherit it instead of re-reading the file
+_KNOWN_BRANDS = _load_brands(_BRANDS_FILE)
+_KNOWN_BRANDS_UPPER = tuple((brand, brand.upper()) for brand in _KNOWN_BRANDS)
 
 
 class BrandDetector:
     """Simple brand detector - you can expand this based on your needs"""
     
-    KNOWN_BRANDS = r"C:\Users\ankun\NewdjangoEnv\Product_scraping\backend\data\brands.json"
+    KNOWN_BRANDS = _BRANDS_FILE
     
     def __init__(self):
-        self.known_brands = self._load_brands()
+        self.known_brands = _KNOWN_BRANDS
     
-    def _load_brands(self):
-        
-        try:
-            with open(self.KNOWN_BRANDS, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return []
-        except json.JSONDecodeError:
-            return []
     def detect_brand(self, name: str) -> Optional[str]:
         """Detect brand from product name"""
         if not name:
@@ -27,8 +84,8 @@ class BrandDetector:
         
         name_upper = name.upper()
         
-        for brand in self.known_brands:
-            if brand.upper() in name_upper:
+        for brand, brand_upper in _KNOWN_BRANDS_UPPER:
+            if brand_upper in name_upper:
                 return brand
         
         # If no known brand found, try to extract first word as brand
@@ -55,56 +112,27 @@ class DescriptionExtractor:
         
         nutrition = {}
         
-        # Common nutritional patterns
-        patterns = {
-            'energy': r'Energy[:\s]*(\d+(?:\.\d+)?)\s*(kJ|kcal|cal)',
-            'fat': r'Fat[:\s]*(\d+(?:\.\d+)?)\s*g',
-            'saturates': r'(?:of which[:\s]*)?saturates[:\s]*(\d+(?:\.\d+)?)\s*g',
-            'carbohydrate': r'Carbohydrate[:\s]*(\d+(?:\.\d+)?)\s*g',
-            'sugars': r'(?:of which[:\s]*)?sugars[:\s]*(\d+(?:\.\d+)?)\s*g',
-            'fibre': r'Fibre[:\s]*(\d+(?:\.\d+)?)\s*g',
-            'protein': r'Protein[:\s]*(\d+(?:\.\d+)?)\s*g',
-            'salt': r'Salt[:\s]*(\d+(?:\.\d+)?)\s*g',
-        }
-        
-        for key, pattern in patterns.items():
-            match = re.search(pattern, description_text, re.IGNORECASE)
-            if match:
-                value = match.group(1)
-                unit = match.group(2) if len(match.groups()) > 1 else 'g'
-                nutrition[key] = f"{value}{unit}"
+        # Single pass over the text; keep the first value found for each field
+        for match in _NUTRITION_RE.finditer(description_text):
+            key = match.lastgroup
+            if key in nutrition:
+                continue
+            unit = match.group('energy_unit') if key == 'energy' else 'g'
+            nutrition[key] = f"{match.group(key + '_value')}{unit}"
         
         return nutrition if nutrition else None
     
     def extract_allergens(self, description_text: str, allergy_warning: str = "") -> List[str]:
         """Extract allergen information"""
-        allergens = []
+        allergens = set()
         
         # Combine both sources
-        full_text = f"{description_text} {allergy_warning}".lower()
-        
-        # Common allergens
-        allergen_patterns = [
-            r'\b(nuts?|peanuts?|tree nuts?)\b',
-            r'\b(milk|dairy|lactose)\b',
-            r'\b(soy|soya)\b',
-            r'\b(wheat|gluten)\b',
-            r'\b(eggs?)\b',
-            r'\b(fish)\b',
-            r'\b(shellfish|crustaceans?)\b',
-            r'\b(sesame)\b',
-            r'\b(mustard)\b',
-            r'\b(celery)\b',
-            r'\b(lupin)\b',
-            r'\b(sulphites?|sulfites?)\b',
-        ]
-        
-        for pattern in allergen_patterns:
-            matches = re.findall(pattern, full_text)
-            if matches:
-                allergens.extend(set(matches))
+        full_text = f"{description_text} {allergy_warning}"
+        
+        for pattern in _ALLERGEN_RES:
+            allergens.update(match.lower() for match in pattern.findall(full_text))
         
-        return list(set(allergens)) if allergens else None
+        return list(allergens) or None
     
     def extract_ingredients(self, description_text: str) -> Optional[str]:
         """Extract ingredients list from description"""
@@ -112,17 +140,12 @@ class DescriptionExtractor:
             return None
         
         # Look for ingredients section
-        patterns = [
-            r'Ingredients?[:\s]+(.*?)(?:\n\n|\.|Storage|Allergy|Nutrition)',
-            r'Contains?[:\s]+(.*?)(?:\n\n|\.|Storage|Allergy|Nutrition)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, description_text, re.IGNORECASE | re.DOTALL)
+        for pattern in _COMPILED_PATTERNS['ingredients']:
+            match = pattern.search(description_text)
             if match:
                 ingredients = match.group(1).strip()
                 # Clean up
-                ingredients = re.sub(r'\s+', ' ', ingredients)
+                ingredients = _COMPILED_PATTERNS['whitespace'].sub(' ', ingredients)
                 return ingredients[:500]  # Limit length
         
         return None
@@ -132,13 +155,8 @@ class DescriptionExtractor:
         if not description_text:
             return None
         
-        patterns = [
-            r'(?:Product of|Made in|Origin[:\s]+)([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+origin',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, description_text)
+        for pattern in _COMPILED_PATTERNS['country']:
+            match = pattern.search(description_text)
             if match:
                 country = match.group(1).strip()
                 # Common countries
@@ -154,16 +172,10 @@ class DescriptionExtractor:
         
         certifications = []
         
-        cert_patterns = [
-            r'\b(vegan|vegetarian|halal|kosher|organic|gluten[- ]free|dairy[- ]free|nut[- ]free)\b',
-        ]
-        
-        text_lower = description_text.lower()
-        
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, text_lower)
+        for pattern in _CERTIFICATION_RES:
+            matches = pattern.findall(description_text)
             if matches:
-                certifications.extend(matches)
+                certifications.extend(match.lower() for match in matches)
         
         return list(set(certifications)) if certifications else None
 
@@ -245,15 +257,19 @@ class ProductCleaner:
     def _remove_descriptors(self, name: str) -> str:
         """Remove common descriptors from product name"""
         result = name
-        for pattern in self.DESCRIPTORS_TO_REMOVE:
-            result = re.sub(pattern, '', result, flags=re.IGNORECASE)
+        for pattern in _COMPILED_PATTERNS['descriptors']:
+            result = pattern.sub('', result)
         return result
     
     def _remove_price_marks(self, name: str) -> str:
         """Remove price mark phrases like PM £1.79, PMP £1.25"""
+        # Every price mark carries a number
+        if not _COMPILED_PATTERNS['digit'].search(name):
+            return name
+        
         result = name
-        for pattern in self.PRICE_MARK_PATTERNS:
-            result = re.sub(pattern, '', result, flags=re.IGNORECASE)
+        for pattern in _COMPILED_PATTERNS['price_marks']:
+            result = pattern.sub('', result)
         return result
     
     def clean_product_name(self, name: str) -> str:
@@ -268,12 +284,12 @@ class ProductCleaner:
         cleaned = name
         
         # Remove trailing barcode numbers
-        cleaned = re.sub(r'\s+\d{10,}$', '', cleaned)
+        cleaned = _COMPILED_PATTERNS['barcode'].sub('', cleaned)
         
-        # Split on multipack patterns and keep first part
-        parts = re.split(r'\d+\s*[×xX]\s*\d+(?:\.\d+)?\s*(?:ml|g|l|kg|cl|oz)', cleaned, flags=re.IGNORECASE)
-        if len(parts) > 1:
-            cleaned = parts[0]
+        # Cut at the first multipack pattern and keep the part before it
+        match = _MULTIPACK_SPLIT_RE.search(cleaned)
+        if match:
+            cleaned = cleaned[:match.start()]
         
         # Remove price marks
         cleaned = self._remove_price_marks(cleaned)
@@ -282,7 +298,7 @@ class ProductCleaner:
         cleaned = self._remove_descriptors(cleaned)
         
         # Remove size information
-        cleaned = re.sub(r'\s*\d+(?:\.\d+)?\s*(?:ml|g|l|kg|cl|oz|fl\s*oz)\b', '', cleaned, flags=re.IGNORECASE)
+        cleaned = _COMPILED_PATTERNS['size'].sub('', cleaned)
         
         # Standardize casing
         cleaned = self.standardize_casing(cleaned)
@@ -301,16 +317,14 @@ class ProductCleaner:
             return None
         
         # Try multipack pattern first: 6x250ml, 4 x 330ml
-        multipack_pattern = r'(\d+)\s*[xX×]\s*(\d+(?:\.\d+)?)\s*(ml|g|kg|l|oz|fl\s*oz)\b'
-        match = re.search(multipack_pattern, name, re.IGNORECASE)
+        match = _COMPILED_PATTERNS['multipack_size'].search(name)
         if match:
             count, size, unit = match.groups()
             unit = unit.lower().replace(' ', '')
             return f"{count}x{size}{unit}"
         
         # Try single size pattern: 500ml, 1.5kg
-        single_pattern = r'(\d+(?:\.\d+)?)\s*(ml|g|kg|l|oz|fl\s*oz)\b'
-        match = re.search(single_pattern, name, re.IGNORECASE)
+        match = _COMPILED_PATTERNS['single_size'].search(name)
         if match:
             size, unit = match.groups()
             unit = unit.lower().replace(' ', '')
@@ -326,15 +340,8 @@ class ProductCleaner:
             return "multipack"
         
         # Check for pack indicators in name
-        pack_indicators = [
-            r'\b\d+\s*pack\b',
-            r'\bpack\s*of\s*\d+\b',
-            r'\b\d+\s*[xX×]\s*\d+',
-            r"\b\d+'?s\b",
-        ]
-        
-        for pattern in pack_indicators:
-            if re.search(pattern, name, re.IGNORECASE):
+        for pattern in _COMPILED_PATTERNS['pack_indicators']:
+            if pattern.search(name):
                 return "multipack"
         
         return "single"
@@ -347,22 +354,19 @@ class ProductCleaner:
         result = name
         
         # Convert long-form units to short-form
-        for long_form, short_form in self.UNIT_MAPPINGS.items():
-            pattern = r'(\d+(?:\.\d+)?)\s*' + re.escape(long_form) + r'\b'
-            result = re.sub(pattern, rf'\1{short_form}', result, flags=re.IGNORECASE)
+        for pattern, replacement in _COMPILED_PATTERNS['long_units']:
+            result = pattern.sub(replacement, result)
         
         # Standardize spacing in units
-        unit_pattern = r'(\d+(?:\.\d+)?)\s*(ml|g|kg|l|oz|fl\s*oz)\b'
         
         def standardize_unit(match):
             number = match.group(1)
             unit = match.group(2).lower().replace(' ', '')
             return f"{number}{unit}"
         
-        result = re.sub(unit_pattern, standardize_unit, result, flags=re.IGNORECASE)
+        result = _COMPILED_PATTERNS['single_size'].sub(standardize_unit, result)
         
         # Handle multipack format
-        multipack_pattern = r'(\d+)\s*[xX×]\s*(\d+(?:\.\d+)?)\s*(ml|g|kg|l)\b'
         
         def standardize_multipack(match):
             count = match.group(1)
@@ -370,7 +374,7 @@ class ProductCleaner:
             unit = match.group(3).lower()
             return f"{count}x{size}{unit}"
         
-        result = re.sub(multipack_pattern, standardize_multipack, result, flags=re.IGNORECASE)
+        result = _COMPILED_PATTERNS['multipack_unit'].sub(standardize_multipack, result)
         
         return result
     
@@ -391,9 +395,9 @@ class ProductCleaner:
             
             if word_lower in special_cases:
                 titled_words.append(special_cases[word_lower])
-            elif re.match(r'^\d+(?:\.\d+)?[a-z]+$', word_lower):
+            elif _COMPILED_PATTERNS['measure_word'].match(word_lower):
                 titled_words.append(word_lower)
-            elif re.match(r'^\d+x\d+[a-z]+$', word_lower):
+            elif _COMPILED_PATTERNS['multipack_word'].match(word_lower):
                 titled_words.append(word_lower)
             elif word_lower in lowercase_words and i > 0:
                 titled_words.append(word_lower)
@@ -404,9 +408,14 @@ class ProductCleaner:
     
     def _clean_whitespace(self, name: str) -> str:
         """Remove extra whitespace and clean up"""
-        result = re.sub(r'\s+', ' ', name)
+        # Text whose only whitespace is single, plain spaces has nothing
+        # to collapse
+        result = name
+        if '  ' in result or not result.isprintable():
+            result = _COMPILED_PATTERNS['whitespace'].sub(' ', result)
         result = result.strip()
-        result = re.sub(r'\s+([,.])', r'\1', result)
+        if ' ,' in result or ' .' in result:
+            result = _COMPILED_PATTERNS['space_punct'].sub(r'\1', result)
         return result
     
     def detect_multipack(self, name: str) -> Optional[Dict]:
@@ -417,16 +426,8 @@ class ProductCleaner:
         if not name:
             return None
         
-        patterns = [
-            r'(\d+)\s*[xX×]\s*(\d+(?:\.\d+)?)\s*(ml|g|l|kg)',
-            r'(\d+)\s*(?:pack|pk|pck)\b',
-            r'pack\s*of\s*(\d+)',
-            r"(\d+)'?s\b",
-            r'(\d+)\s*multi\s*pack',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, name, re.IGNORECASE)
+        for pattern in _COMPILED_PATTERNS['multipack']:
+            match = pattern.search(name)
             if match:
                 groups = match.groups()
                 
@@ -462,13 +463,13 @@ class ProductCleaner:
         slug = slug.replace('&', 'and')
         
         # Remove special characters
-        slug = re.sub(r'[^a-z0-9\s-]', '', slug)
+        slug = _COMPILED_PATTERNS['slug_invalid'].sub('', slug)
         
         # Replace spaces with hyphens
-        slug = re.sub(r'\s+', '-', slug)
+        slug = _COMPILED_PATTERNS['whitespace'].sub('-', slug)
         
         # Remove multiple hyphens
-        slug = re.sub(r'-+', '-', slug)
+        slug = _COMPILED_PATTERNS['hyphens'].sub('-', slug)
         
         # Remove leading/trailing hyphens
         slug = slug.strip('-')
@@ -491,11 +492,8 @@ class ProductCleaner:
         price = product.get('price', 'N/A')
         if price and price != 'N/A':
             # Extract numeric value
-            price_match = re.search(r'[\d.]+', str(price))
-            if price_match:
-                cleaned['price'] = float(price_match.group())
-            else:
-                cleaned['price'] = None
+            price_match = _COMPILED_PATTERNS['price'].search(str(price))
+            cleaned['price'] = float(price_match.group()) if price_match else None
         else:
             cleaned['price'] = None
         
@@ -621,6 +619,57 @@ class ProductCleaner:
         return cleaned_all
 
 
+# Every regex the cleaners use, compiled once at import and shared by all
+# instances (and by forked workers via copy-on-write)
+_COMPILED_PATTERNS = {
+    'ingredients': [
+        re.compile(r'Ingredients?[:\s]+(.*?)(?:\n\n|\.|Storage|Allergy|Nutrition)', re.IGNORECASE | re.DOTALL),
+        re.compile(r'Contains?[:\s]+(.*?)(?:\n\n|\.|Storage|Allergy|Nutrition)', re.IGNORECASE | re.DOTALL),
+    ],
+    'country': [
+        re.compile(r'(?:Product of|Made in|Origin[:\s]+)([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'),
+        re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+origin'),
+    ],
+    'price_marks': [re.compile(pattern, re.IGNORECASE) for pattern in ProductCleaner.PRICE_MARK_PATTERNS],
+    'descriptors': [re.compile(pattern, re.IGNORECASE) for pattern in ProductCleaner.DESCRIPTORS_TO_REMOVE],
+    'long_units': [
+        (re.compile(r'(\d+(?:\.\d+)?)\s*' + re.escape(long_form) + r'\b', re.IGNORECASE), rf'\1{short_form}')
+        for long_form, short_form in ProductCleaner.UNIT_MAPPINGS.items()
+    ],
+    'barcode': re.compile(r'\s+\d{10,}$'),
+    'digit': re.compile(r'\d'),
+    'size': re.compile(r'\s*\d+(?:\.\d+)?\s*(?:ml|g|l|kg|cl|oz|fl\s*oz)\b', re.IGNORECASE),
+    'single_size': re.compile(r'(\d+(?:\.\d+)?)\s*(ml|g|kg|l|oz|fl\s*oz)\b', re.IGNORECASE),
+    'multipack_size': re.compile(r'(\d+)\s*[xX×]\s*(\d+(?:\.\d+)?)\s*(ml|g|kg|l|oz|fl\s*oz)\b', re.IGNORECASE),
+    'multipack_unit': re.compile(r'(\d+)\s*[xX×]\s*(\d+(?:\.\d+)?)\s*(ml|g|kg|l)\b', re.IGNORECASE),
+    'pack_indicators': [
+        re.compile(pattern, re.IGNORECASE) for pattern in (
+            r'\b\d+\s*pack\b',
+            r'\bpack\s*of\s*\d+\b',
+            r'\b\d+\s*[xX×]\s*\d+',
+            r"\b\d+'?s\b",
+        )
+    ],
+    'multipack': [
+        re.compile(pattern, re.IGNORECASE) for pattern in (
+            r'(\d+)\s*[xX×]\s*(\d+(?:\.\d+)?)\s*(ml|g|l|kg)',
+            r'(\d+)\s*(?:pack|pk|pck)\b',
+            r'pack\s*of\s*(\d+)',
+            r"(\d+)'?s\b",
+            r'(\d+)\s*multi\s*pack',
+        )
+    ],
+    'measure_word': re.compile(r'^\d+(?:\.\d+)?[a-z]+$'),
+    'multipack_word': re.compile(r'^\d+x\d+[a-z]+$'),
+    'whitespace': re.compile(r'\s+'),
+    'space_punct': re.compile(r'\s+([,.])'),
+    'slug_invalid': re.compile(r'[^a-z0-9\s-]'),
+    'hyphens': re.compile(r'-+'),
+    # First number in a price string; ranges and offers keep their leading figure
+    'price': re.compile(r'\d+(?:\.\d+)?'),
+}
+
+
 # Export singleton instance
 product_cleaner = ProductCleaner()
 
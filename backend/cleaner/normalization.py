@@ -9,6 +9,31 @@ from typing import Any, List, Optional, Union, Dict
 from datetime import datetime
 
 
+def _trie_pattern(words) -> str:
+    """
+    Build a regex alternation matching any of `words`, with shared prefixes
+    factored out (e.g. kilo, kilos, kilogram -> kilo(?:gram|s)?)
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}  # end-of-word marker
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        is_word_end = '' in node
+        if len(branches) == 1 and not is_word_end:
+            return branches[0]
+        pattern = '(?:' + '|'.join(branches) + ')'
+        return pattern + '?' if is_word_end else pattern
+
+    return build(trie)
+
+
 class NormalizationEngine:
     """
     Handles data cleaning, standardization, and type enforcement.
@@ -94,8 +119,93 @@ class NormalizationEngine:
         'tin': 'Tin',
     }
     
+    # Words that should stay lowercase in titles (unless first word)
+    _LOWERCASE_WORDS = frozenset({'and', 'or', 'the', 'a', 'an', 'of', 'for', 'with', 'in', 'on', '&'})
+    
+    # Words with fixed casing in titles
+    _SPECIAL_CASES = {
+        'ml': 'ml', 'g': 'g', 'kg': 'kg', 'l': 'l', 'oz': 'oz', 'cl': 'cl',
+        'pk': 'pk', 'uk': 'UK', 'usa': 'USA', 'bbb': 'BBB',
+    }
+    
+    # Compiled once at class load; the methods below only call these
+    # Each pattern group is one alternation so a name is scanned once per group
+    _PRICE_MARK_RE = re.compile('|'.join(f'(?:{p})' for p in PRICE_MARK_PATTERNS), re.IGNORECASE)
+    _DESCRIPTOR_RE = re.compile('|'.join(f'(?:{p})' for p in DESCRIPTORS_TO_REMOVE), re.IGNORECASE)
+    _LONG_UNIT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(' + _trie_pattern(UNIT_MAPPINGS) + r')\b', re.IGNORECASE)
+    _PACKAGING_RE = re.compile(r'\b(' + _trie_pattern(PACKAGING_TYPES) + r')\b')
+    # Earlier PACKAGING_TYPES entries win when a text mentions several
+    _PACKAGING_PRIORITY = {variant: i for i, variant in enumerate(PACKAGING_TYPES)}
+    _BARCODE_RE = re.compile(r'\s+\d{10,}$')
+    _MULTIPACK_SPLIT_RE = re.compile(r'\d+\s*[×xX]\s*\d+(?:\.\d+)?\s*(?:ml|g|l|kg|cl|oz)', re.IGNORECASE)
+    _UNIT_STRIP_RE = re.compile(r'\s*\d+(?:\.\d+)?\s*(?:ml|g|l|kg|cl|oz|fl\s*oz)\b', re.IGNORECASE)
+    # Single sizes and multipacks (optional "6 x" prefix) in one pattern
+    _SIZE_RE = re.compile(r'(?:(\d+)\s*[xX×]\s*)?(\d+(?:\.\d+)?)\s*(ml|g|kg|l|oz|cl|fl\s*oz)\b', re.IGNORECASE)
+    _VOLUME_RE = re.compile(r'(\d+(?:\.\d+)?)(ml|l|cl|fl\s*oz)\b', re.IGNORECASE)
+    _WEIGHT_RE = re.compile(r'(\d+(?:\.\d+)?)(g|kg|oz)\b', re.IGNORECASE)
+    _MEASURE_WORD_RE = re.compile(r'^\d+(?:\.\d+)?[a-z]+$')
+    _MULTIPACK_WORD_RE = re.compile(r'^\d+x\d+[a-z]+$')
+    _WS_RE = re.compile(r'\s+')
+    _SPACE_PUNCT_RE = re.compile(r'\s+([,.])')
+    _LIST_SPLIT_RE = re.compile(r'[,;]')
+    _NUM_RE = re.compile(r'(\d+\.?\d*)')
+    _DIGIT_RE = re.compile(r'\d')
+    # Substrings every DESCRIPTORS_TO_REMOVE match contains (lowercased)
+    _DESCRIPTOR_HINTS = ('single', 'new', 'edition')
+    _WEIGHT_VALUE_RE = re.compile(r'(\d+\.?\d*)\s*(g|kg|oz|lb|mg)?')
+    _VOLUME_VALUE_RE = re.compile(r'(\d+\.?\d*)\s*(ml|l|cl|fl oz|gal)?')
+    _SLUG_INVALID_RE = re.compile(r'[^a-z0-9\s-]')
+    _SLUG_SEPARATOR_RE = re.compile(r'[\s-]+')
+    # Same cut as the multipack search in clean_product_name, as a sub
+    _MULTIPACK_TAIL_RE = re.compile('(?s:' + _MULTIPACK_SPLIT_RE.pattern + '.*)', re.IGNORECASE)
+    # The deletion stages of clean_product_name as one alternation, so a
+    # name is rewritten in a single scan once the multipack tail is cut
+    _STRIP_ALL_RE = re.compile('|'.join([
+        _BARCODE_RE.pattern,
+        *(f'(?:{p})' for p in PRICE_MARK_PATTERNS),
+        *(f'(?:{p})' for p in DESCRIPTORS_TO_REMOVE),
+        _UNIT_STRIP_RE.pattern,
+    ]), re.IGNORECASE)
+    
+    # Null-like strings (lowercased) that normalize to None
+    _NULL_SET = frozenset({'null', 'none', 'n/a', 'na', '-', ''})
+    _TRUE_SET = frozenset({'true', 'yes', 'y', '1', 'on'})
+    _FALSE_SET = frozenset({'false', 'no', 'n', '0', 'off'})
+    
+    # Unit factors for normalize_weight (to grams) and normalize_volume (to ml)
+    _WEIGHT_CONV = {
+        'g': 1,
+        'kg': 1000,
+        'mg': 0.001,
+        'oz': 28.3495,
+        'lb': 453.592,
+    }
+    _VOL_CONV = {
+        'ml': 1,
+        'l': 1000,
+        'cl': 10,
+        'fl oz': 29.5735,
+        'gal': 3785.41,
+    }
+    
+    # Upper bound on memoized names/slugs/numbers before the caches are reset
+    _CACHE_SIZE = 65536
+    
     def __init__(self):
+        # Scraped names repeat across pages and sources, so memoize the
+        # two name pipelines on the raw string
+        self._name_cache = {}
+        self._slug_cache = {}
+        # Prices and sizes repeat just as often: (kind, raw string) -> parsed value
+        self._numeric_cache = {}
         self.category_mappings = self._load_category_mappings()
+        # Inverse lookup: variation -> standard category. Built in reverse so
+        # the first category listing a variation wins, as in the old scan.
+        self._category_index = {
+            variation: standard_cat
+            for standard_cat, variations in reversed(self.category_mappings.items())
+            for variation in variations
+        }
     
     def _load_category_mappings(self):
         """Define standard category names and their variations."""
@@ -127,24 +237,13 @@ class NormalizationEngine:
             return ""
         
         name = str(name)
-        cleaned = name
+        cached = self._name_cache.get(name)
+        if cached is not None:
+            return cached
         
-        # Remove trailing barcode (10+ digits)
-        cleaned = re.sub(r'\s+\d{10,}$', '', cleaned)
-        
-        # Remove multipack size info (e.g., "6x330ml")
-        parts = re.split(r'\d+\s*[×xX]\s*\d+(?:\.\d+)?\s*(?:ml|g|l|kg|cl|oz)', cleaned, flags=re.IGNORECASE)
-        if len(parts) > 1:
-            cleaned = parts[0]
-        
-        # Remove price marks
-        cleaned = self._remove_price_marks(cleaned)
-        
-        # Remove generic descriptors
-        cleaned = self._remove_descriptors(cleaned)
-        
-        # Remove unit measurements (but keep in Package Size field)
-        cleaned = re.sub(r'\s*\d+(?:\.\d+)?\s*(?:ml|g|l|kg|cl|oz|fl\s*oz)\b', '', cleaned, flags=re.IGNORECASE)
+        # Remove barcode, multipack info, price marks, generic descriptors
+        # and unit measurements (but keep in Package Size field)
+        cleaned = self._strip_noise(name)
         
         # Standardize casing
         cleaned = self.standardize_casing(cleaned)
@@ -152,21 +251,62 @@ class NormalizationEngine:
         # Clean whitespace
         cleaned = self._clean_whitespace(cleaned)
         
+        if len(self._name_cache) >= self._CACHE_SIZE:
+            self._name_cache.clear()
+        self._name_cache[name] = cleaned
         return cleaned
     
+    def _strip_noise(self, name: str) -> str:
+        """Run the deletion stages of clean_product_name, without casing"""
+        # Every rule but the descriptors needs a digit, so ASCII names with
+        # neither skip both scans (other text may case-fold into a match)
+        if (name.isascii() and not self._DIGIT_RE.search(name)
+                and not any(hint in name.lower() for hint in self._DESCRIPTOR_HINTS)):
+            return name
+        
+        # Drop multipack size info (e.g., "6x330ml") and everything after it
+        multipack = self._MULTIPACK_SPLIT_RE.search(name)
+        if multipack:
+            name = name[:multipack.start()]
+        
+        return self._STRIP_ALL_RE.sub('', name)
+    
+    def clean_product_names(self, names: List[Any]) -> List[str]:
+        """
+        Batch version of clean_product_name
+        Runs each stage over the whole column with pandas and fills the
+        name cache, so later per-product calls are lookups
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            return [self.clean_product_name(name) for name in names]
+        
+        raw = pd.Series([str(name) if name else '' for name in names], dtype=object)
+        cleaned = (
+            raw.str.replace(self._MULTIPACK_TAIL_RE, '', n=1, regex=True)
+            .str.replace(self._STRIP_ALL_RE, '', regex=True)
+            .map(self.standardize_casing)
+            .str.replace(self._WS_RE, ' ', regex=True)
+            .str.strip()
+            .str.replace(self._SPACE_PUNCT_RE, r'\1', regex=True)
+        )
+        
+        cache = self._name_cache
+        for name, result in zip(raw, cleaned):
+            if name:
+                if len(cache) >= self._CACHE_SIZE:
+                    cache.clear()
+                cache[name] = result
+        return cleaned.tolist()
+    
     def _remove_price_marks(self, name: str) -> str:
         """Remove price mark phrases like PM £1.79, PMP £1.25"""
-        result = name
-        for pattern in self.PRICE_MARK_PATTERNS:
-            result = re.sub(pattern, '', result, flags=re.IGNORECASE)
-        return result
+        return self._PRICE_MARK_RE.sub('', name)
     
     def _remove_descriptors(self, name: str) -> str:
         """Remove generic descriptors"""
-        result = name
-        for pattern in self.DESCRIPTORS_TO_REMOVE:
-            result = re.sub(pattern, '', result, flags=re.IGNORECASE)
-        return result
+        return self._DESCRIPTOR_RE.sub('', name)
     
     def standardize_casing(self, name: str) -> str:
         """
@@ -174,27 +314,21 @@ class NormalizationEngine:
         """
         words = name.split()
         titled_words = []
-        
-        # Words that should stay lowercase (unless first word)
-        lowercase_words = {'and', 'or', 'the', 'a', 'an', 'of', 'for', 'with', 'in', 'on', '&'}
-        
-        # Special cases that should stay as-is
-        special_cases = {
-            'ml': 'ml', 'g': 'g', 'kg': 'kg', 'l': 'l', 'oz': 'oz', 'cl': 'cl',
-            'pk': 'pk', 'uk': 'UK', 'usa': 'USA', 'bbb': 'BBB',
-        }
+        special_cases = self._SPECIAL_CASES
+        lowercase_words = self._LOWERCASE_WORDS
         
         for i, word in enumerate(words):
             word_lower = word.lower()
             
             # Check special cases first
-            if word_lower in special_cases:
-                titled_words.append(special_cases[word_lower])
+            special = special_cases.get(word_lower)
+            if special:
+                titled_words.append(special)
             # Keep measurements lowercase (e.g., "250ml")
-            elif re.match(r'^\d+(?:\.\d+)?[a-z]+$', word_lower):
+            elif self._MEASURE_WORD_RE.match(word_lower):
                 titled_words.append(word_lower)
             # Keep multipack format lowercase (e.g., "6x330ml")
-            elif re.match(r'^\d+x\d+[a-z]+$', word_lower):
+            elif self._MULTIPACK_WORD_RE.match(word_lower):
                 titled_words.append(word_lower)
             # Lowercase conjunctions (but not if first word)
             elif word_lower in lowercase_words and i > 0:
@@ -207,12 +341,16 @@ class NormalizationEngine:
     
     def _clean_whitespace(self, name: str) -> str:
         """Remove extra whitespace and clean up"""
-        # Replace multiple spaces with single space
-        result = re.sub(r'\s+', ' ', name)
+        # Replace multiple spaces with single space; text whose only
+        # whitespace is single, plain spaces has nothing to collapse
+        result = name
+        if '  ' in result or not result.isprintable():
+            result = self._WS_RE.sub(' ', result)
         # Remove leading/trailing whitespace
         result = result.strip()
         # Remove space before punctuation
-        result = re.sub(r'\s+([,.])', r'\1', result)
+        if ' ,' in result or ' .' in result:
+            result = self._SPACE_PUNCT_RE.sub(r'\1', result)
         return result
     
     # ========== UNIT STANDARDIZATION ==========
@@ -229,30 +367,26 @@ class NormalizationEngine:
         result = text
         
         # Convert long-form units to short-form
-        for long_form, short_form in self.UNIT_MAPPINGS.items():
-            pattern = r'(\d+(?:\.\d+)?)\s*' + re.escape(long_form) + r'\b'
-            result = re.sub(pattern, rf'\1{short_form}', result, flags=re.IGNORECASE)
-        
-        # Standardize existing short-form units (remove spaces)
-        unit_pattern = r'(\d+(?:\.\d+)?)\s*(ml|g|kg|l|oz|cl|fl\s*oz)\b'
-        
-        def standardize_unit(match):
-            number = match.group(1)
-            unit = match.group(2).lower().replace(' ', '')
-            return f"{number}{unit}"
-        
-        result = re.sub(unit_pattern, standardize_unit, result, flags=re.IGNORECASE)
-        
-        # Handle multipack format: 6x250ml, 4 x 330ml
-        multipack_pattern = r'(\d+)\s*[xX×]\s*(\d+(?:\.\d+)?)\s*(ml|g|kg|l|cl|oz)\b'
-        
-        def standardize_multipack(match):
-            count = match.group(1)
-            size = match.group(2)
-            unit = match.group(3).lower()
+        def to_short_form(match):
+            unit = match.group(2)
+            return f"{match.group(1)}{self.UNIT_MAPPINGS.get(unit.lower(), unit)}"
+        
+        result = self._LONG_UNIT_RE.sub(to_short_form, result)
+        
+        # Standardize existing short-form units (remove spaces) and
+        # multipack format: 6x250ml, 4 x 330ml
+        
+        def standardize_size(match):
+            count, size, unit = match.groups()
+            unit = unit.lower().replace(' ', '')
+            if not count:
+                return f"{size}{unit}"
+            if unit == 'floz':
+                # fl oz multipacks only get the size tightened
+                return f"{match.group()[:match.start(2) - match.start()]}{size}{unit}"
             return f"{count}x{size}{unit}"
         
-        result = re.sub(multipack_pattern, standardize_multipack, result, flags=re.IGNORECASE)
+        result = self._SIZE_RE.sub(standardize_size, result)
         
         return result
     
@@ -268,8 +402,7 @@ class NormalizationEngine:
         standardized = self.standardize_units(text)
         
         # Volume units
-        volume_pattern = r'(\d+(?:\.\d+)?)(ml|l|cl|fl\s*oz)\b'
-        match = re.search(volume_pattern, standardized, re.IGNORECASE)
+        match = self._VOLUME_RE.search(standardized)
         if match:
             return {
                 'value': float(match.group(1)),
@@ -278,8 +411,7 @@ class NormalizationEngine:
             }
         
         # Weight units
-        weight_pattern = r'(\d+(?:\.\d+)?)(g|kg|oz)\b'
-        match = re.search(weight_pattern, standardized, re.IGNORECASE)
+        match = self._WEIGHT_RE.search(standardized)
         if match:
             return {
                 'value': float(match.group(1)),
@@ -299,11 +431,11 @@ class NormalizationEngine:
         
         text_lower = text.lower()
         
-        for variant, standard in self.PACKAGING_TYPES.items():
-            if re.search(r'\b' + variant + r'\b', text_lower):
-                return standard
+        variants = {match.group(1) for match in self._PACKAGING_RE.finditer(text_lower)}
+        if not variants:
+            return None
         
-        return None
+        return self.PACKAGING_TYPES[min(variants, key=self._PACKAGING_PRIORITY.__getitem__)]
     
     # ========== STANDARD NORMALIZATION ==========
     
@@ -316,35 +448,58 @@ class NormalizationEngine:
         text = str(value).strip()
         
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = self._WS_RE.sub(' ', text)
         
         # Remove null-like values
-        if text.lower() in ['null', 'none', 'n/a', 'na', '-', '']:
+        if text.lower() in self._NULL_SET:
             return None
         
         return text if text else None
     
-    def normalize_number(self, value: Any) -> Optional[float]:
-        """Normalize numeric fields: extract numbers, handle units."""
-        if value is None or value == '':
+    def _coerce(self, value: Any) -> Optional[str]:
+        """Stripped, lowercased text of a value, or None if it is null-like"""
+        if value is None:
             return None
         
+        text = str(value).strip().lower()
+        return None if text in self._NULL_SET else text
+    
+    def _cached_parse(self, kind: str, value: Any, parse) -> Optional[float]:
+        """Run a numeric parse, memoized on the raw string"""
+        if not isinstance(value, str):
+            return parse(value)
+        
+        key = (kind, value)
+        try:
+            return self._numeric_cache[key]
+        except KeyError:
+            pass
+        
+        result = parse(value)
+        if len(self._numeric_cache) >= self._CACHE_SIZE:
+            self._numeric_cache.clear()
+        self._numeric_cache[key] = result
+        return result
+    
+    def normalize_number(self, value: Any) -> Optional[float]:
+        """Normalize numeric fields: extract numbers, handle units."""
         # If already a number
         if isinstance(value, (int, float)):
             return float(value)
         
-        # Convert to string and clean
-        text = str(value).strip().lower()
-        
-        # Handle null-like values
-        if text in ['null', 'none', 'n/a', 'na', '-', '']:
+        return self._cached_parse('number', value, self._parse_number)
+    
+    def _parse_number(self, value: Any) -> Optional[float]:
+        # Convert to string and clean, handling null-like values
+        text = self._coerce(value)
+        if text is None:
             return None
         
         # Remove currency symbols and commas
         text = text.replace('£', '').replace('$', '').replace(',', '')
         
         # Extract first number found
-        match = re.search(r'(\d+\.?\d*)', text)
+        match = self._NUM_RE.search(text)
         if match:
             try:
                 return float(match.group(1))
@@ -355,26 +510,22 @@ class NormalizationEngine:
     
     def normalize_boolean(self, value: Any) -> Optional[bool]:
         """Normalize boolean fields."""
-        if value is None or value == '':
-            return None
-        
         if isinstance(value, bool):
             return value
         
-        text = str(value).strip().lower()
+        # Null values
+        text = self._coerce(value)
+        if text is None:
+            return None
         
         # True values
-        if text in ['true', 'yes', 'y', '1', 'on']:
+        if text in self._TRUE_SET:
             return True
         
         # False values
-        if text in ['false', 'no', 'n', '0', 'off']:
+        if text in self._FALSE_SET:
             return False
         
-        # Null values
-        if text in ['null', 'none', 'n/a', 'na', '-', '']:
-            return None
-        
         return None
     
     def normalize_list(self, value: Any) -> Optional[List[str]]:
@@ -391,11 +542,11 @@ class NormalizationEngine:
         
         # String that might be comma-separated
         text = str(value).strip()
-        if text.lower() in ['null', 'none', 'n/a', 'na', '-', '']:
+        if text.lower() in self._NULL_SET:
             return None
         
         # Split by comma or semicolon
-        items = re.split(r'[,;]', text)
+        items = self._LIST_SPLIT_RE.split(text)
         cleaned = [self.normalize_text(item) for item in items]
         cleaned = [item for item in cleaned if item]
         
@@ -420,37 +571,27 @@ class NormalizationEngine:
         if not category:
             return None
         
-        category_lower = category.lower()
-        
-        # Map to standard category
-        for standard_cat, variations in self.category_mappings.items():
-            if category_lower in variations:
-                return standard_cat
-        
-        # Return title cased original if no mapping
-        return self.standardize_casing(category)
+        # Map to standard category, or title case the original if no mapping
+        standard_cat = self._category_index.get(category.lower())
+        return standard_cat or self.standardize_casing(category)
     
     def normalize_price(self, value: Any) -> Optional[float]:
         """Normalize price values (remove currency, convert to float)"""
-        if value is None or value == '':
-            return None
-        
-        # Handle 'N/A' and similar
-        if str(value).upper() in ['N/A', 'NA', 'NONE', 'NULL']:
-            return None
-        
-        # Use number normalization (handles currency removal)
+        # Use number normalization (handles currency removal and 'N/A'
+        # and similar)
         return self.normalize_number(value)
     
     def normalize_weight(self, value: Any) -> Optional[float]:
         """Normalize weight values (convert to grams)"""
-        if value is None or value == '':
+        return self._cached_parse('weight', value, self._parse_weight)
+    
+    def _parse_weight(self, value: Any) -> Optional[float]:
+        text = self._coerce(value)
+        if text is None:
             return None
         
-        text = str(value).strip().lower()
-        
         # Extract number and unit
-        match = re.search(r'(\d+\.?\d*)\s*(g|kg|oz|lb|mg)?', text)
+        match = self._WEIGHT_VALUE_RE.search(text)
         if not match:
             return None
         
@@ -458,25 +599,19 @@ class NormalizationEngine:
         unit = match.group(2) if match.group(2) else 'g'
         
         # Convert to grams
-        conversions = {
-            'g': 1,
-            'kg': 1000,
-            'mg': 0.001,
-            'oz': 28.3495,
-            'lb': 453.592,
-        }
-        
-        return number * conversions.get(unit, 1)
+        return number * self._WEIGHT_CONV.get(unit, 1)
     
     def normalize_volume(self, value: Any) -> Optional[float]:
         """Normalize volume values (convert to ml)"""
-        if value is None or value == '':
+        return self._cached_parse('volume', value, self._parse_volume)
+    
+    def _parse_volume(self, value: Any) -> Optional[float]:
+        text = self._coerce(value)
+        if text is None:
             return None
         
-        text = str(value).strip().lower()
-        
         # Extract number and unit
-        match = re.search(r'(\d+\.?\d*)\s*(ml|l|cl|fl oz|gal)?', text)
+        match = self._VOLUME_VALUE_RE.search(text)
         if not match:
             return None
         
@@ -484,15 +619,7 @@ class NormalizationEngine:
         unit = match.group(2) if match.group(2) else 'ml'
         
         # Convert to ml
-        conversions = {
-            'ml': 1,
-            'l': 1000,
-            'cl': 10,
-            'fl oz': 29.5735,
-            'gal': 3785.41,
-        }
-        
-        return number * conversions.get(unit, 1)
+        return number * self._VOL_CONV.get(unit, 1)
     
     def generate_slug(self, name: str) -> str:
         """
@@ -501,25 +628,38 @@ class NormalizationEngine:
         if not name:
             return ""
         
-        # First clean the name
-        cleaned = self.clean_product_name(name)
+        name = str(name)
+        cached = self._slug_cache.get(name)
+        if cached is not None:
+            return cached
+        
+        # Strip the same noise as clean_product_name. Its casing is undone
+        # by lowercasing for ASCII text; title-casing can expand other
+        # letters (ß -> Ss), so keep it there
+        slug = self._strip_noise(name)
+        if not slug.isascii():
+            slug = self.standardize_casing(slug)
+        
+        # Of the whitespace tidying only the joins before punctuation
+        # survive the hyphenation below
+        slug = self._SPACE_PUNCT_RE.sub(r'\1', slug)
         
         # Convert to lowercase
-        slug = cleaned.lower()
+        slug = slug.lower()
         
         # Replace '&' with 'and'
         slug = slug.replace('&', 'and')
         
         # Remove special characters except alphanumeric, spaces, hyphens
-        slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-        
-        # Replace spaces with hyphens
-        slug = re.sub(r'\s+', '-', slug)
+        slug = self._SLUG_INVALID_RE.sub('', slug)
         
-        # Remove multiple consecutive hyphens
-        slug = re.sub(r'-+', '-', slug)
+        # Replace each run of spaces/hyphens with a single hyphen
+        slug = self._SLUG_SEPARATOR_RE.sub('-', slug)
         
         # Remove leading/trailing hyphens
         slug = slug.strip('-')
         
+        if len(self._slug_cache) >= self._CACHE_SIZE:
+            self._slug_cache.clear()
+        self._slug_cache[name] = slug
         return slug
\ No newline at end of file
@@ -3,9 +3,20 @@ from typing import Optional
 import unicodedata
 
 
+def _ascii_fold(char: str) -> str:
+    """NFKD-decompose a character and drop whatever is not ASCII"""
+    return unicodedata.normalize('NFKD', char).encode('ascii', 'ignore').decode('ascii')
+
+
+# Precomputed folds for Latin-1 and Latin Extended-A/B (é → e, etc.)
+_ASCII_FOLD_TABLE = {code: _ascii_fold(chr(code)) for code in range(0x80, 0x250)}
+
+
 class SlugGenerator:
     """Generates SEO-friendly slugs"""
 
+    __slots__ = ('max_length', '_cache')
+
     CHAR_REPLACEMENTS = {
         '&': 'and',
         '+': 'plus',
@@ -20,8 +31,29 @@ class SlugGenerator:
         '©': '',
     }
     
+    # CHAR_REPLACEMENTS as one translate table: words are padded with
+    # spaces and dropped symbols become a space
+    _CHAR_TABLE = str.maketrans({
+        char: f' {replacement} ' if replacement else ' '
+        for char, replacement in CHAR_REPLACEMENTS.items()
+    })
+    
+    # Deletes every ASCII char that is not a-z, 0-9 (when kept), whitespace
+    # or a hyphen; the slug is plain ASCII by the time these are applied
+    _DROP_TABLE = str.maketrans('', '', ''.join(
+        c for c in map(chr, range(128)) if not re.match(r'[a-z0-9\s-]', c)
+    ))
+    _DROP_DIGITS_TABLE = str.maketrans('', '', ''.join(
+        c for c in map(chr, range(128)) if not re.match(r'[a-z\s-]', c)
+    ))
+    _SEPARATOR_RE = re.compile(r'[\s-]+')
+    
+    # Upper bound on memoized slugs before the cache is reset
+    CACHE_SIZE = 65536
+    
     def __init__(self, max_length: int = 100):
         self.max_length = max_length
+        self._cache = {}
     
     def generate(self, text: str, preserve_numbers: bool = True) -> str:
         """
@@ -37,30 +69,30 @@ class SlugGenerator:
         if not text:
             return ""
         
+        key = (text, preserve_numbers)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
         slug = text
         
         # Convert to lowercase
         slug = slug.lower()
         
         # Replace special characters
-        for char, replacement in self.CHAR_REPLACEMENTS.items():
-            slug = slug.replace(char, f' {replacement} ' if replacement else ' ')
+        slug = slug.translate(self._CHAR_TABLE)
         
         # Normalize unicode characters (é → e, etc.)
-        slug = unicodedata.normalize('NFKD', slug)
-        slug = slug.encode('ascii', 'ignore').decode('ascii')
+        if not slug.isascii():
+            slug = slug.translate(_ASCII_FOLD_TABLE)
+            if not slug.isascii():
+                slug = _ascii_fold(slug)
         
         # Keep only alphanumeric, spaces, and hyphens
-        if preserve_numbers:
-            slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-        else:
-            slug = re.sub(r'[^a-z\s-]', '', slug)
-        
-        # Replace whitespace with hyphens
-        slug = re.sub(r'\s+', '-', slug)
+        slug = slug.translate(self._DROP_TABLE if preserve_numbers else self._DROP_DIGITS_TABLE)
         
-        # Remove multiple consecutive hyphens
-        slug = re.sub(r'-+', '-', slug)
+        # Collapse each run of whitespace/hyphens into a single hyphen
+        slug = self._SEPARATOR_RE.sub('-', slug)
         
         # Remove leading/trailing hyphens
         slug = slug.strip('-')
@@ -72,6 +104,9 @@ class SlugGenerator:
             if last_hyphen > self.max_length // 2:
                 slug = slug[:last_hyphen]
         
+        if len(self._cache) >= self.CACHE_SIZE:
+            self._cache.clear()
+        self._cache[key] = slug
         return slug
     
     def generate_unique(self, text: str, existing_slugs: set) -> str:
@@ -7,7 +7,6 @@ Includes brand detection, product cleaning, and description extraction
 
 import argparse
 from pathlib import Path
-from cleaner_integrated import IntegratedProductCleaner, clean_and_merge
 
 
 def main():
@@ -40,6 +39,13 @@ def main():
         default=None
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Worker processes for cleaning (default: clean in-process)',
+        default=None
+    )
+    
     parser.add_argument(
         '--sources',
         nargs='+',
@@ -116,7 +122,11 @@ def main():
     print("✓ Smart Inference")
     print("="*70)
     
-    products = clean_and_merge(valid_sources, args.output, args.brands)
+    # Imported here so --help and bad arguments don't pay for loading
+    # the cleaner and its brand data
+    from cleaner_integrated import clean_and_merge
+    
+    products = clean_and_merge(valid_sources, args.output, args.brands, args.workers)
     
     print("\n" + "="*70)
     print("✓ PIPELINE COMPLETE")
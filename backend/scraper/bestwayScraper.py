@@ -6,17 +6,149 @@ Integrates with the central cleaning pipeline
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import json
+from selectolax.lexbor import LexborHTMLParser
+import asyncio
+import aiohttp
+import hashlib
+import math
+import random
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import time
 import sys
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output is optional
+    pa = None
+
 # Add parent directory to path to handle relative imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from cleaner.cleaner_intergated import IntegratedProductCleaner
 
+# Current desktop browser User-Agents, one picked at random per request
+UA_POOL = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14.2; rv:121.0) Gecko/20100101 Firefox/121.0",
+]
+
+# Pretty-printed like the old json.dump(indent=2) output
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _next_sibling(node, tag, class_name=None):
+    """Next sibling element with the given tag (and class), like bs4's find_next_sibling"""
+    sibling = node.next
+    while sibling is not None:
+        if sibling.tag == tag and (
+            class_name is None or class_name in (sibling.attributes.get("class") or "").split()
+        ):
+            return sibling
+        sibling = sibling.next
+    return None
+
+
+def _get_th_value(th_map, label):
+    """Text of the <td> next to the first header containing label (case-insensitive)"""
+    label = label.lower()
+    th = next((th for text, th in th_map.items() if label in text), None)
+    if th:
+        td = _next_sibling(th, "td")
+        return td.text(strip=True) if td else None
+    return None
+
+
+def parse_product_details(html):
+    """Extract the detail fields from a product page's HTML (str or raw bytes)"""
+    tree = LexborHTMLParser(html)
+
+    # Collect every table header and accordion button in one pass each,
+    # keyed by text (the first node wins, as with a document-order find)
+    th_map = {}
+    for th in tree.css("th"):
+        th_map.setdefault(th.text().lower(), th)
+    buttons = {}
+    for btn in tree.css("div.accordionButton"):
+        buttons.setdefault(btn.text(), btn)
+
+    def get_accordion_content(tab):
+        return _next_sibling(tab, "div", "accordionContent") if tab else None
+
+    def find_button(fragment):
+        return next((btn for text, btn in buttons.items() if fragment in text.lower()), None)
+
+    # Extract description
+    description_content = get_accordion_content(buttons.get("Description"))
+
+    description = None
+    description_bullets = []
+    if description_content:
+        description_bullets = [
+            li.text(strip=True)
+            for li in description_content.css("ul li")
+        ]
+        desc_p = description_content.css_first('[itemprop="description"] p')
+        description = desc_p.text(strip=True) if desc_p else None
+
+    # Extract ingredients
+    nutritions = {}
+
+    ingredients_content = get_accordion_content(find_button("ingredients"))
+
+    if ingredients_content:
+        # First table after the "Nutritional Information" heading
+        table = None
+        h2_found = False
+        for node in ingredients_content.traverse():
+            if not h2_found:
+                h2_found = (
+                    node.tag == "h2"
+                    and "nutritional information" in node.text().lower()
+                )
+            elif node.tag == "table":
+                table = node
+                break
+
+        if table:
+            for row in table.css("tr"):
+                th = row.css_first("th")
+                td = row.css_first("td")   # only ONE td per row in your HTML
+
+                if th and td and th.text(strip=True):
+                    nutritions[th.text(strip=True)] = td.text(strip=True)
+
+    # Extract other info
+    other_content = get_accordion_content(find_button("other info"))
+
+    other_info = []
+    if other_content:
+        other_info = [li.text(strip=True) for li in other_content.css("ul li")]
+
+    return {
+        "product": _get_th_value(th_map, "Product"),
+        "rsp": _get_th_value(th_map, "RSP:"),
+        "brand": _get_th_value(th_map, "Brand:"),
+        "size": _get_th_value(th_map, "Pack Size:"),
+        "product_code": _get_th_value(th_map, "Product Code:"),
+        "Retail Ean": _get_th_value(th_map, "Retail EAN:"),
+        "vat_rate": _get_th_value(th_map, "VAT Rate:"),
+        "description": description,
+        "description_bullets": description_bullets,
+        "ingredients_description": nutritions,
+        "other_info": other_info,
+    }
+
 
 class BestwayScraper:
     """Scraper for Bestway Wholesale UK"""
@@ -27,193 +159,309 @@ class BestwayScraper:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # The User-Agent is overridden per request from UA_POOL
         self.headers = {
-            "User-Agent": "Mozilla/5.0"
+            "User-Agent": UA_POOL[0],
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-GB,en;q=0.9",
+            "Accept-Encoding": "gzip, br",
         }
         
-        self.all_products = []
+        # One keep-alive session for every request to the site, retrying
+        # throttled and transient server errors with backoff
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
+        
+        # Scraped products stored column-wise: one list per field, all of
+        # length product_count (fields a product lacks are None)
+        self.cols = defaultdict(list)
+        self.product_count = 0
         self.cleaner = IntegratedProductCleaner()
         self.items_per_page = 20
+        # Detail pages fetched at once per listing page
+        self.detail_concurrency = 8
+        # Listing pages kept in flight ahead of the one being parsed
+        self.listing_workers = 4
+        # Extra attempts for a listing page whose fetch fails
+        self.page_retries = 2
+        # Listing pages that parsed are kept under .cache, keyed by URL, and
+        # reused by later runs for cache_ttl seconds
+        self.cache_dir = self.output_dir / ".cache"
+        self.cache_ttl = 3600
+        
+        # Adaptive pause between listing pages: doubles when the server
+        # throttles us, decays back toward the floor while it doesn't
+        self.min_interval_floor = 0.3
+        self.max_interval = 30.0
+        self.min_interval = self.min_interval_floor
+        self._last_request_time = 0.0
+        self._pace_lock = threading.Lock()
+    
+    def _rotate_ua(self):
+        """Per-request header override with a random User-Agent"""
+        # Passed to each get() rather than set on the shared session, which
+        # the listing threads use concurrently
+        return {"User-Agent": random.choice(UA_POOL)}
     
     def scrape_product_details(self, product_url):
         """Scrape additional details from individual product page"""
         try:
-            response = requests.get(product_url, headers=self.headers, timeout=10)
+            response = self.session.get(product_url, headers=self._rotate_ua(), timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            def get_table_value(label):
-                th = soup.find("th", string=lambda x: x and label.lower() in x.lower())
-                if th:
-                    td = th.find_next_sibling("td")
-                    return td.get_text(strip=True) if td else None
-                return None
-            
-            # Extract description
-            description_tab = soup.find("div", class_="accordionButton", string="Description")
-            description_content = description_tab.find_next_sibling(
-                "div", class_="accordionContent"
-            ) if description_tab else None
-
-            description = None
-            description_bullets = []
-            if description_content:
-                description_bullets = [
-                    li.get_text(strip=True)
-                    for li in description_content.select("ul li")
-                ]
-                desc_p = description_content.select_one('[itemprop="description"] p')
-                description = desc_p.get_text(strip=True) if desc_p else None
-            
-            # Extract ingredients
-            nutritions = {}
-
-            ingredients_tab = soup.find(
-                "div",
-                class_="accordionButton",
-                string=lambda x: x and "ingredients" in x.lower()
-            )
-            
-            ingredients_content = (
-                ingredients_tab.find_next_sibling("div", class_="accordionContent")
-                if ingredients_tab else None
-            )
-            
-            if ingredients_content:
-                h2 = ingredients_content.find(
-                    "h2",
-                    string=lambda x: x and "nutritional information" in x.lower()
-                )
-            
-                if h2:
-                    table = h2.find_next("table")
-            
-                    if table:
-                        for row in table.find_all("tr"):
-                            th = row.find("th")
-                            td = row.find("td")   # only ONE td per row in your HTML
-            
-                            if th and td and th.get_text(strip=True):
-                                nutritions[th.get_text(strip=True)] = td.get_text(strip=True)
-            
-            print(nutritions)
-
-            
-            # Extract other info
-            other_tab = soup.find(
-                "div", class_="accordionButton", string=lambda x: x and "other info" in x.lower()
-            )
-            other_content = other_tab.find_next_sibling(
-                "div", class_="accordionContent"
-            ) if other_tab else None
-
-            other_info = []
-            if other_content:
-                other_info = [li.get_text(strip=True) for li in other_content.select("ul li")]
-            
-            return {
-                "product": get_table_value("Product"),
-                "rsp": get_table_value("RSP:"),
-                "brand": get_table_value("Brand:"),
-                "size": get_table_value("Pack Size:"),
-                "product_code": get_table_value("Product Code:"),
-                "Retail Ean": get_table_value("Retail EAN:"),
-                "vat_rate": get_table_value("VAT Rate:"),
-                "description": description,
-                "description_bullets": description_bullets,
-                "ingredients_description": nutritions,
-                "other_info": other_info,
-            }
+            return parse_product_details(response.content)
         except Exception as e:
             print(f"Error scraping details for {product_url}: {e}")
             return {"product": None, "rsp": None, "brand": None}
     
+    def _wait_turn(self):
+        """Block until min_interval has passed since the last listing request started"""
+        with self._pace_lock:
+            delay = self.min_interval - (time.monotonic() - self._last_request_time)
+            if delay > 0:
+                time.sleep(delay)
+            self._last_request_time = time.monotonic()
+    
+    def _listing_url(self, page):
+        # Construct URL with pagination parameter
+        return f"{self.base_url}?s={page * self.items_per_page}"
+    
+    def _listing_cache_file(self, url):
+        return self.cache_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.html"
+    
+    def _get_listing(self, page):
+        """
+        Fetch one listing page's HTML as (html, from_cache), from an unexpired
+        cache entry when there is one (runs on the listing thread pool)
+        """
+        url = self._listing_url(page)
+        cache_file = self._listing_cache_file(url)
+        try:
+            if time.time() - cache_file.stat().st_mtime < self.cache_ttl:
+                return cache_file.read_bytes(), True
+        except FileNotFoundError:
+            pass
+        
+        self._wait_turn()  # Be respectful to the server
+        response = self.session.get(url, headers=self._rotate_ua(), timeout=10)
+        self._adapt_rate(response.status_code, response.headers.get("Retry-After"))
+        response.raise_for_status()
+        return response.content, False
+    
+    def _listing_future(self, executor, futures, page, pages_needed):
+        """Future for a listing page, submitting the pages after it ahead of time"""
+        last_page = max(page, min(page + self.listing_workers, pages_needed) - 1)
+        for p in range(page, last_page + 1):
+            if p not in futures:
+                futures[p] = executor.submit(self._get_listing, p)
+        return futures.pop(page)
+    
+    def _adapt_rate(self, status, retry_after=None):
+        """Back off on 429/Retry-After, otherwise ease back toward the floor"""
+        if status == 429 or retry_after:
+            self.min_interval = min(self.min_interval * 2, self.max_interval)
+            try:
+                # Retry-After in seconds; HTTP-date values are ignored
+                self.min_interval = max(self.min_interval, float(retry_after))
+            except (TypeError, ValueError):
+                pass
+        else:
+            self.min_interval = max(self.min_interval * 0.9, self.min_interval_floor)
+    
+    async def _fetch_details(self, sem, session, product_url):
+        """Async version of scrape_product_details on a shared aiohttp session"""
+        async with sem:
+            try:
+                async with session.get(product_url, headers=self._rotate_ua()) as response:
+                    if response.status == 429:
+                        self._adapt_rate(response.status, response.headers.get("Retry-After"))
+                    response.raise_for_status()
+                    html = await response.read()
+                return parse_product_details(html)
+            except Exception as e:
+                print(f"Error scraping details for {product_url}: {e}")
+                return {"product": None, "rsp": None, "brand": None}
+    
     def scrape_products(self):
         """Scrape products from all pages"""
+        return asyncio.run(self._scrape_products_async())
+    
+    async def _scrape_products_async(self):
+        """Scrape listing pages in order, fetching each page's detail pages concurrently"""
         print("=" * 70)
         print("PHASE 1: SCRAPING RAW PRODUCTS")
         print("=" * 70)
         
         page = 0
+        pages_needed = math.ceil(self.target_products / self.items_per_page)
+        listing_futures = {}
+        executor = ThreadPoolExecutor(max_workers=self.listing_workers)
+        sem = asyncio.Semaphore(self.detail_concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=self.detail_concurrency)
+        timeout = aiohttp.ClientTimeout(total=10)
         
-        try:
-            while len(self.all_products) < self.target_products:
-                # Construct URL with pagination parameter
-                url = f"{self.base_url}?s={page * self.items_per_page}"
-                print(f"\n🔍 Scraping page {page}... (Current count: {len(self.all_products)})")
+        # Each product is also appended here as a JSON line once scraped,
+        # so the data can be stream-read (and survives an aborted run)
+        raw_stream_file = self.output_dir / "bestwayraw_products.jsonl"
+        
+        with open(raw_stream_file, "wb") as raw_stream:
+            async with aiohttp.ClientSession(
+                headers=self.headers, connector=connector, timeout=timeout
+            ) as session:
+                try:
+                    while self.product_count < self.target_products:
+                        future = self._listing_future(executor, listing_futures, page, pages_needed)
+                        page_products = await self._load_listing(page, future, executor)
+                        if page_products is None:
+                            break
+                        await self._scrape_page(page_products, sem, session, raw_stream)
+                        page += 1
+                
+                except Exception as e:
+                    print(f"❌ Error during scraping: {e}")
+                    return False
                 
-                response = requests.get(url, headers=self.headers, timeout=10)
-                response.raise_for_status()
+                finally:
+                    # Drop listing pages fetched ahead that are no longer needed
+                    executor.shutdown(wait=False, cancel_futures=True)
+        
+        return True
+    
+    async def _load_listing(self, page, future, executor):
+        """Fetch and parse one listing page, retrying the fetch on network/HTTP errors"""
+        cache_file = self._listing_cache_file(self._listing_url(page))
+        
+        for attempt in range(self.page_retries + 1):
+            try:
+                html, from_cache = await asyncio.wrap_future(future)
+            except requests.RequestException as e:
+                if attempt == self.page_retries:
+                    cache_file.unlink(missing_ok=True)
+                    raise
+                print(f"⚠️  Page {page} fetch failed ({e}), retrying...")
+                future = executor.submit(self._get_listing, page)
+                continue
+            
+            try:
+                page_products = self._parse_listing(page, html)
+            except Exception:
+                # Bytes that failed to parse are never kept; a cached copy
+                # gets one fresh fetch, a fresh one would just fail again
+                cache_file.unlink(missing_ok=True)
+                if from_cache and attempt < self.page_retries:
+                    print(f"⚠️  Cached page {page} didn't parse, fetching it again...")
+                    future = executor.submit(self._get_listing, page)
+                    continue
+                raise
+            
+            if not from_cache:
+                self.cache_dir.mkdir(exist_ok=True)
+                cache_file.write_bytes(html)
+            return page_products
+    
+    def _parse_listing(self, page, html):
+        """Parse one listing page into (product_data, url_path) pairs; None once pagination has ended"""
+        print(f"\n🔍 Scraping page {page}... (Current count: {self.product_count})")
+        
+        soup = BeautifulSoup(html, "lxml")
+
+        # Find main container
+        container = soup.find("div", class_="shop-products-column")
+        
+        if not container:
+            print("❌ No products container found. Pagination may have ended.")
+            return None
 
-                soup = BeautifulSoup(response.text, "html.parser")
+        # Get all product items
+        products = container.select("ul.shop-products > li")
 
-                # Find main container
-                container = soup.find("div", class_="shop-products-column")
+        if not products:
+            print("❌ No products found on this page. Stopping.")
+            return None
+
+        print(f"✅ Found {len(products)} products on page {page}")
+
+        page_products = []
+        for product in products:
+            if self.product_count + len(page_products) >= self.target_products:
+                break
                 
-                if not container:
-                    print("❌ No products container found. Pagination may have ended.")
-                    break
-
-                # Get all product items
-                products = container.select("ul.shop-products > li")
-
-                if not products:
-                    print("❌ No products found on this page. Stopping.")
-                    break
-
-                print(f"✅ Found {len(products)} products on page {page}")
-
-                for product in products:
-                    if len(self.all_products) >= self.target_products:
-                        break
-                        
-                    product_id = product.get("data-ga-product-id")
-                    name = product.get("data-ga-product-name")
-                    price = product.get("data-ga-product-price")
-                    category = product.get("data-ga-product-category")
-                    url_path = product.get("data-ga-product-url")
-                    product_img = product.get("data-ga-product-image") 
-                    img_tag = product.select_one(".prodimageinner img")
-                    
-                    image_url = None
-                    if img_tag:
-                        image_url = img_tag.get("src") or img_tag.get("data-src")
-                        # Handle relative URLs
-                        if image_url and image_url.startswith("/"):
-                            image_url = f"https://www.bestwaywholesale.co.uk{image_url}"
-
-                    sku = product.select_one(".prodsku")
-                    size = product.select_one(".prodsize")
-
-                    product_data = {
-                        "id": product_id,
-                        "name": name,
-                        "price": price,
-                        "category": category,
-                        "sku": sku.text.replace("SKU:", "").strip() if sku else None,
-                        "multi pack": size.text.strip() if size else None,
-                        "image": image_url,
-                        "url": f"https://www.bestwaywholesale.co.uk{url_path}"
-                    }
-                    
-                    # Scrape additional details from product page
-                    if url_path:
-                        product_url = f"https://www.bestwaywholesale.co.uk{url_path}"
-                        details = self.scrape_product_details(product_url)
-                        product_data.update(details)
-                    
-                    self.all_products.append(product_data)
-                    print(f"   {len(self.all_products)}. {name}")
+            product_id = product.get("data-ga-product-id")
+            name = product.get("data-ga-product-name")
+            price = product.get("data-ga-product-price")
+            category = product.get("data-ga-product-category")
+            url_path = product.get("data-ga-product-url")
+            product_img = product.get("data-ga-product-image") 
+            img_tag = product.select_one(".prodimageinner img")
+            
+            image_url = None
+            if img_tag:
+                image_url = img_tag.get("src") or img_tag.get("data-src")
+                # Handle relative URLs
+                if image_url and image_url.startswith("/"):
+                    image_url = f"https://www.bestwaywholesale.co.uk{image_url}"
 
-                page += 1
-                time.sleep(1)  # Be respectful to the server
+            sku = product.select_one(".prodsku")
+            size = product.select_one(".prodsize")
+
+            product_data = {
+                "id": product_id,
+                "name": name,
+                "price": price,
+                "category": category,
+                "sku": sku.text.replace("SKU:", "").strip() if sku else None,
+                "multi pack": size.text.strip() if size else None,
+                "image": image_url,
+                "url": f"https://www.bestwaywholesale.co.uk{url_path}"
+            }
+            page_products.append((product_data, url_path))
         
-        except Exception as e:
-            print(f"❌ Error during scraping: {e}")
-            return False
+        return page_products
+    
+    async def _scrape_page(self, page_products, sem, session, raw_stream):
+        """Fetch the detail pages for one parsed listing page and record its products"""
+        # Scrape additional details from all product pages at once
+        details = iter(await asyncio.gather(*[
+            self._fetch_details(sem, session, f"https://www.bestwaywholesale.co.uk{url_path}")
+            for _, url_path in page_products
+            if url_path
+        ]))
         
-        return True
+        for product_data, url_path in page_products:
+            if url_path:
+                product_data.update(next(details))
+            
+            self._add_product(product_data)
+            raw_stream.write(orjson.dumps(product_data, option=orjson.OPT_NON_STR_KEYS) + b"\n")
+            if self.product_count % 10 == 0:
+                print(f"   Scraped {self.product_count}/{self.target_products} products...")
+    
+    @property
+    def all_products(self):
+        """Scraped products as a list of row dicts"""
+        return list(self.iter_products())
+    
+    def iter_products(self):
+        """Yield scraped products as row dicts, built lazily from the columns"""
+        keys = list(self.cols)
+        for values in zip(*self.cols.values()):
+            yield dict(zip(keys, values))
+    
+    def _add_product(self, product_data):
+        """Append one product to the column store"""
+        for key in product_data:
+            if key not in self.cols:
+                # Backfill a field first seen on this product
+                self.cols[key].extend([None] * self.product_count)
+        for key, column in self.cols.items():
+            column.append(product_data.get(key))
+        self.product_count += 1
     
     def save_raw_products(self):
         """Save raw products to JSON"""
@@ -223,12 +471,21 @@ class BestwayScraper:
         
         raw_output_file = self.output_dir / "bestwayraw_products.json"
         
-        with open(raw_output_file, "w", encoding="utf-8") as f:
-            json.dump(self.all_products, f, indent=2, ensure_ascii=False)
+        with open(raw_output_file, "wb") as f:
+            f.write(orjson.dumps(list(self.iter_products()), option=_JSON_OPTIONS))
         
-        print(f"✅ Successfully scraped {len(self.all_products)} products!")
+        print(f"✅ Successfully scraped {self.product_count} products!")
         print(f"📁 Raw data saved to {raw_output_file}")
         
+        # Columnar copy for downstream loading, when pyarrow is installed
+        if pa is not None and self.product_count:
+            parquet_file = self.output_dir / "bestwayraw_products.parquet"
+            try:
+                pq.write_table(pa.Table.from_pydict(self.cols), parquet_file)
+                print(f"📁 Columnar copy saved to {parquet_file}")
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                print(f"⚠️  Skipped Parquet output: {e}")
+        
         return raw_output_file
     
     def clean_and_save_products(self):
@@ -241,31 +498,41 @@ class BestwayScraper:
         print("   ├─ Field normalization")
         print("   └─ Schema enforcement")
         
-        # Process each raw product through the integrated cleaner
+        # Process each raw product through the integrated cleaner, streaming
+        # each result to JSON lines as it is produced
         cleaned_products = []
-        for i, raw_product in enumerate(self.all_products, 1):
-            try:
-                # Clean and normalize the product
-                cleaned_product = self.cleaner.clean_and_normalize_product(raw_product)
+        cleaner = self.cleaner
+        source_meta = {
+            "source_name": "Bestway Wholesale",
+            "source_url": "https://www.bestwaywholesale.co.uk",
+        }
+        
+        # Clean every product name in one batch pass up front; the
+        # per-product cleaner below then reads them from its cache
+        cleaner.normalizer.clean_product_names([name or "" for name in self.cols.get("name", ())])
+        
+        cleaned_stream_file = self.output_dir / "bestway_cleaned_products.jsonl"
+        with open(cleaned_stream_file, "wb") as cleaned_stream:
+            for i, raw_product in enumerate(self.iter_products(), 1):
+                try:
+                    # Clean and normalize the product
+                    cleaned_product = cleaner.clean_and_normalize_product(raw_product)
                 
-                # Add source metadata
-                cleaned_product = self.cleaner.add_source_metadata(
-                    cleaned_product,
-                    source_name="Bestway Wholesale",
-                    source_url="https://www.bestwaywholesale.co.uk"
-                )
+                    # Add source metadata
+                    cleaned_product = cleaner.add_source_metadata(cleaned_product, **source_meta)
                 
-                # Enforce schema
-                cleaned_product = self.cleaner.enforce_schema(cleaned_product)
+                    # Enforce schema
+                    cleaned_product = cleaner.enforce_schema(cleaned_product)
                 
-                cleaned_products.append(cleaned_product)
+                    cleaned_products.append(cleaned_product)
+                    cleaned_stream.write(orjson.dumps(cleaned_product, option=orjson.OPT_NON_STR_KEYS) + b"\n")
                 
-                if i % 10 == 0:
-                    print(f"   Processed {i}/{len(self.all_products)} products...")
+                    if i % 10 == 0:
+                        print(f"   Processed {i}/{self.product_count} products...")
                     
-            except Exception as e:
-                print(f"   ⚠️  Error processing product {i}: {e}")
-                continue
+                except Exception as e:
+                    print(f"   ⚠️  Error processing product {i}: {e}")
+                    continue
         
         # Save cleaned data
         print("\n" + "=" * 70)
@@ -273,16 +540,16 @@ class BestwayScraper:
         print("=" * 70)
         
         cleaned_output_file = self.output_dir / "bestway_cleaned_products.json"
-        with open(cleaned_output_file, "w", encoding="utf-8") as f:
-            json.dump(cleaned_products, f, indent=2, ensure_ascii=False)
+        with open(cleaned_output_file, "wb") as f:
+            f.write(orjson.dumps(cleaned_products, option=_JSON_OPTIONS))
         
         print(f"✨ Cleaned {len(cleaned_products)} products successfully!")
         print(f"📁 Cleaned data saved to {cleaned_output_file}")
         print(f"\n📊 Pipeline Summary:")
-        print(f"   Raw products: {len(self.all_products)}")
+        print(f"   Raw products: {self.product_count}")
         print(f"   Cleaned products: {len(cleaned_products)}")
-        if len(self.all_products) > 0:
-            print(f"   Success rate: {len(cleaned_products)/len(self.all_products)*100:.1f}%")
+        if self.product_count > 0:
+            print(f"   Success rate: {len(cleaned_products)/self.product_count*100:.1f}%")
         
         return cleaned_output_file, cleaned_products
     
@@ -293,7 +560,12 @@ class BestwayScraper:
         print("=" * 80)
         
         # Phase 1: Scrape
-        if not self.scrape_products():
+        try:
+            scraped = self.scrape_products()
+        finally:
+            self.session.close()
+        
+        if not scraped:
             print("❌ Scraping failed")
             return None, None
         
@@ -1,5 +1,12 @@
+import json
+import re
+
 import pandas as pd
+import requests
 
+_NEXT_DATA_RE = re.compile(
+    r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>', re.S
+)
 
 file_path = r'C:\Users\ankun\NewdjangoEnv\Product_scraping\backend\data\bestway_cleaned_products.json'
 def export_to_csv(data: list[dict], file_path: str) -> None:
@@ -7,28 +14,35 @@ def export_to_csv(data: list[dict], file_path: str) -> None:
     df.to_csv(file_path, index=False)
     return df
 
+def fetch_next_data(product_url: str = "https://www.wegetanystock.com/grocery", session=None) -> dict:
+    """
+    Read a Next.js page's embedded __NEXT_DATA__ JSON.
+    The hydration data is in the server response, so a plain GET is enough;
+    a headless browser is only started if the script tag isn't there.
+    """
+    http = session or requests
+    response = http.get(product_url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
+
+    # Cloudflare answers a plain GET with 403/503; that's what the browser is for
+    if response.status_code == 200:
+        match = _NEXT_DATA_RE.search(response.text)
+        if match:
+            return json.loads(match.group(1))
+
+    from DrissionPage import ChromiumPage
+
+    page = ChromiumPage()
+    try:
+        page.get(product_url)
+        script = page.ele('#__NEXT_DATA__')
+        return json.loads(script.text)
+    finally:
+        page.quit()
+
+
 if __name__ == "__main__":
     data = pd.read_json(file_path)
     print(f"Data loaded from {file_path}, total records: {len(data)}")
     csv_path = file_path.replace('.json', '.csv')
     data.to_csv(csv_path, index=False)
     print(f"Data exported to {csv_path}")
-    
-# from DrissionPage import ChromiumPage
-# import json, re
-
-# product_url = "https://www.wegetanystock.com/grocery"
-# page = ChromiumPage()
-# page.get(product_url)
-
-# html = page.html
-# match = re.search(
-#     r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>',
-#     html,
-#     re.S
-# )
-
-# script = page.ele('#__NEXT_DATA__')
-# data = json.loads(script.text)
-
-
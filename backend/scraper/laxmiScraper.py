@@ -1,19 +1,162 @@
 import requests
-from bs4 import BeautifulSoup
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import asyncio
+import aiohttp
+import orjson
+import contextlib
 import csv
+import itertools
+import logging
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add parent directory to path to import cleaner
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from cleaner.cleaner_intergated import IntegratedProductCleaner
 
+# Per-page and per-product progress goes through logging (debug / info),
+# so batch runs can silence it; run summaries stay as prints
+logger = logging.getLogger(__name__)
+
+# Pretty-printed like json.dump(indent=2); orjson never escapes non-ASCII
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# C-backed lxml parser when available, stdlib html.parser otherwise
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# selectolax is much faster than BeautifulSoup for the simple class-based
+# lookups on the homepage and collection pages; BS4 is used without it
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# pandas writes the CSV export in C; the csv module is used without it
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# On-disk HTTP cache for re-runs, enabled with LAXMI_CACHE=1
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+
+# CSS selectors shared by every page parsed, so each is compiled once
+# and then served from the selector engine's cache
+_CSS_DROPDOWN = "div.yv-dropdown-detail"
+_CSS_DROPDOWN_TITLE = "a.dropdown-menu-item"
+_CSS_DROPDOWN_LINK = "a.yv-dropdown-item-link"
+_CSS_CATEGORY_BLOCK = "div.dropdown-inner-menu-item"
+_CSS_CATEGORY_TITLE = "a.menu-category-title"
+_CSS_PRODUCTS = "div.row[data-collection-products]"
+_CSS_CARD = "div.col-6[data-product-grid]"
+_CSS_CARD_INFO = "div.yv-product-information"
+_CSS_CARD_IMG = "div.yv-product-card-img"
+_CSS_TITLE = "a.yv-product-title"
+_CSS_IMG_LINK = "a.yv-product-img"
+_CSS_PRICE = "span.product-price"
+_CSS_ACCORDION = "div.yv-product-accordion"
+_CSS_DESCRIPTION = "div.product-description"
+_CSS_ACCORDION_CARD = "details.yv-accordion-card"
+_CSS_ACCORDION_TITLE = "summary h6"
+_CSS_ACCORDION_BODY = "div.yv-content-body"
+
+
+# Allergy warning and storage advice in a product description, in one
+# pass: the warning runs up to the storage advice, which runs to the end
+_DESC_RE = re.compile(
+    r"(?:Allergy Warning:?\s*(?P<allergy>.*?))?(?:Storage Advice:?\s*(?P<storage>.*))?$",
+    re.S | re.I,
+)
+
+# Parse-time filters for BeautifulSoup: only the subtree a parser reads is
+# built, skipping the header, footer and scripts around it
+NAV_STRAINER = SoupStrainer("div", class_="yv-dropdown-detail")
+PRODUCTS_STRAINER = SoupStrainer("div", attrs={"data-collection-products": True})
+DETAILS_STRAINER = SoupStrainer("div", class_=["yv-product-accordion", "product-description"])
+
+
+def _iter_products(all_products):
+    """
+    Yield (category, subcategory, product) for every product
+
+    Accepts the nested {category: {subcategory: [products]}} structure, a
+    category holding its products directly (subcategory is None) or a flat
+    list of products (category and subcategory are None)
+    """
+    if not isinstance(all_products, dict):
+        for product in all_products if isinstance(all_products, list) else [all_products]:
+            yield None, None, product
+        return
+
+    for category, subcategories in all_products.items():
+        if not isinstance(subcategories, dict):
+            for product in subcategories if isinstance(subcategories, list) else [subcategories]:
+                yield category, None, product
+            continue
+        for subcategory, products in subcategories.items():
+            if isinstance(products, list):
+                for product in products:
+                    yield category, subcategory, product
+
+
+# Node helpers so the list-page parsers work on either backend
+def _css(node, selector):
+    return node.css(selector) if LexborHTMLParser else node.select(selector)
+
+
+def _css_first(node, selector):
+    return node.css_first(selector) if LexborHTMLParser else node.select_one(selector)
+
+
+def _node_text(node):
+    return node.text(strip=True) if LexborHTMLParser else node.get_text(strip=True)
+
+
+def _node_attr(node, name, default=""):
+    value = node.attributes.get(name) if LexborHTMLParser else node.get(name)
+    return default if value is None else value
+
 
 class LakshmiGroceryScraper:
     def __init__(self):
         self.base_url = "https://www.lakshmiwholesale.com"
-        self.session = requests.Session()
+        self.cache_enabled = os.environ.get("LAXMI_CACHE") == "1"
+        if self.cache_enabled and requests_cache is None:
+            print("⚠️  LAXMI_CACHE is set but requests_cache is not installed; caching disabled")
+            self.cache_enabled = False
+
+        if self.cache_enabled:
+            # Successful responses are replayed from SQLite for a day
+            self.session = requests_cache.CachedSession(
+                cache_name="laxmi_cache",
+                backend="sqlite",
+                expire_after=86400,
+                allowable_codes=(200,),
+            )
+        else:
+            self.session = requests.Session()
+        # Large keep-alive pool so concurrent requests reuse warm TLS
+        # connections instead of re-handshaking past the default 10
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -21,11 +164,26 @@ class LakshmiGroceryScraper:
                           "Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
+            # Decompressed transparently; br needs the brotli package
+            "Accept-Encoding": "gzip, deflate, br",
             "Connection": "keep-alive",
         }
 
         self.grocery_data = {}
         self.product_cleaner = IntegratedProductCleaner()
+        # Parsed homepage, shared by the grocery and brands navigation
+        self._homepage_soup = None
+
+        # Async fetching in scrape_all_products: requests in flight overall
+        # and per host, plus backoff for throttled / failing responses
+        self.concurrency = 64
+        self.per_host_limit = 20
+        self.max_retries = 3
+        self.backoff_factor = 0.5
+        # Threads fetching product pages in the sync scrape_products_with_details
+        self.detail_workers = 25
+        # Products per request from the Shopify products.json API (its maximum)
+        self.api_page_limit = 250
 
         # 🔑 bypass age / wholesale gate
         self._verify_access()
@@ -34,8 +192,10 @@ class LakshmiGroceryScraper:
     # AGE / WHOLESALE VERIFICATION
     # --------------------------------------------------
     def _verify_access(self):
-        # establish session
-        self.session.get(self.base_url, headers=self.headers, timeout=30)
+        # establish session; only the cookies are needed, so the homepage
+        # body is never downloaded or buffered
+        with self.session.get(self.base_url, headers=self.headers, timeout=30, stream=True):
+            pass
 
         # set verification cookie
         self.session.cookies.set(
@@ -48,7 +208,7 @@ class LakshmiGroceryScraper:
     # --------------------------------------------------
     # FETCH PAGE
     # --------------------------------------------------
-    def get_page(self, url):
+    def _fetch(self, url):
         try:
             response = self.session.get(
                 url,
@@ -56,11 +216,65 @@ class LakshmiGroceryScraper:
                 timeout=30
             )
             response.raise_for_status()
-            return BeautifulSoup(response.text, "html.parser")
+            return response.content
         except requests.RequestException as e:
             print(f"❌ Error fetching {url}: {e}")
             return None
 
+    def get_page(self, url, strainer=None):
+        content = self._fetch(url)
+        if content is None:
+            return None
+        # Raw bytes let the parser detect the encoding itself
+        return BeautifulSoup(content, HTML_PARSER, parse_only=strainer)
+
+    def get_tree(self, url, strainer=None):
+        """Fetch a page for the list-page parsers (selectolax, or BS4 without it)"""
+        content = self._fetch(url)
+        if content is None:
+            return None
+        return self._make_tree(content, strainer)
+
+    def _make_tree(self, content, strainer=None):
+        # The strainer only applies to BS4; selectolax parses the whole page
+        if LexborHTMLParser is None:
+            return BeautifulSoup(content, HTML_PARSER, parse_only=strainer)
+        return LexborHTMLParser(content)
+
+    async def _aget(self, sem, session, url):
+        """Async fetch returning the body bytes (None on failure), backing off on 429/5xx"""
+        if self.cache_enabled:
+            # Go through the cached requests session so re-runs skip the network
+            async with sem:
+                return await asyncio.to_thread(self._fetch, url)
+        
+        for attempt in range(self.max_retries + 1):
+            async with sem:
+                try:
+                    async with session.get(url) as response:
+                        if response.status == 429 or response.status >= 500:
+                            error = f"HTTP {response.status}"
+                        else:
+                            response.raise_for_status()
+                            return await response.read()
+                except aiohttp.ClientResponseError as e:
+                    print(f"❌ Error fetching {url}: {e}")
+                    return None
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    error = e
+            
+            if attempt == self.max_retries:
+                print(f"❌ Error fetching {url}: {error}")
+                return None
+            # Back off outside the semaphore so other requests keep going
+            await asyncio.sleep(self.backoff_factor * 2 ** attempt)
+
+    def _get_homepage(self):
+        """Homepage navigation tree, fetched and parsed only once per scraper"""
+        if self._homepage_soup is None:
+            self._homepage_soup = self.get_tree(self.base_url, NAV_STRAINER)
+        return self._homepage_soup
+
     # --------------------------------------------------
     # SCRAPE BRANDS NAVIGATION
     # --------------------------------------------------
@@ -72,21 +286,21 @@ class LakshmiGroceryScraper:
             list: List of brand names
         """
         print("🔍 Fetching brands from navigation...")
-        soup = self.get_page(self.base_url)
+        soup = self._get_homepage()
 
         if not soup:
             return []
 
         # Find the BRANDS dropdown container
         brands_dropdown_container = None
-        all_dropdowns = soup.find_all("div", class_="yv-dropdown-detail")
+        all_dropdowns = _css(soup, _CSS_DROPDOWN)
         
-        print(f"[DEBUG] Searching for BRANDS in {len(all_dropdowns)} dropdown containers")
+        logger.debug("Searching for BRANDS in %d dropdown containers", len(all_dropdowns))
         
         for dropdown in all_dropdowns:
-            link = dropdown.find("a", class_="dropdown-menu-item")
-            if link and link.get_text(strip=True).upper() == "BRANDS":
-                print("[DEBUG] ✓ Found BRANDS dropdown container")
+            link = _css_first(dropdown, _CSS_DROPDOWN_TITLE)
+            if link and _node_text(link).upper() == "BRANDS":
+                logger.debug("✓ Found BRANDS dropdown container")
                 brands_dropdown_container = dropdown
                 break
             
@@ -97,15 +311,15 @@ class LakshmiGroceryScraper:
         brands = []
         
         # Extract all brand links from the brands dropdown container
-        brand_links = brands_dropdown_container.find_all("a", class_="yv-dropdown-item-link")
+        brand_links = _css(brands_dropdown_container, _CSS_DROPDOWN_LINK)
         
         print(f"✅ Found {len(brand_links)} brands")
         
         for link in brand_links:
-            brand_name = link.get_text(strip=True)
+            brand_name = _node_text(link)
             if brand_name:
                 brands.append(brand_name)
-                print(f"   ✓ {brand_name}")
+                logger.debug("   ✓ %s", brand_name)
         
         return sorted(list(set(brands)))  # Remove duplicates and sort
 
@@ -114,21 +328,21 @@ class LakshmiGroceryScraper:
     # --------------------------------------------------
     def get_grocery_navigation(self):
         print("🔍 Fetching homepage...")
-        soup = self.get_page(self.base_url)
+        soup = self._get_homepage()
 
         if not soup:
             return None
 
         # find ONLY the grocery mega menu
         grocery_dropdown_container = None
-        all_dropdowns = soup.find_all("div", class_="yv-dropdown-detail")
+        all_dropdowns = _css(soup, _CSS_DROPDOWN)
         
-        print(f"[DEBUG] Found {len(all_dropdowns)} dropdown containers")
+        logger.debug("Found %d dropdown containers", len(all_dropdowns))
         
         for dropdown in all_dropdowns:
-            link = dropdown.find("a", class_="dropdown-menu-item")
-            if link and link.get_text(strip=True).upper() == "GROCERIES":
-                print("[DEBUG] ✓ Found GROCERIES dropdown container")
+            link = _css_first(dropdown, _CSS_DROPDOWN_TITLE)
+            if link and _node_text(link).upper() == "GROCERIES":
+                logger.debug("✓ Found GROCERIES dropdown container")
                 grocery_dropdown_container = dropdown
                 break
             
@@ -142,29 +356,23 @@ class LakshmiGroceryScraper:
         }
 
         # Extract categories from inside the grocery dropdown container
-        category_blocks = grocery_dropdown_container.find_all(
-            "div",
-            class_="dropdown-inner-menu-item"
-        )
+        category_blocks = _css(grocery_dropdown_container, _CSS_CATEGORY_BLOCK)
 
         print(f"✅ Found {len(category_blocks)} grocery categories")
 
         for block in category_blocks:
-            title_elem = block.find("a", class_="menu-category-title")
+            title_elem = _css_first(block, _CSS_CATEGORY_TITLE)
             if not title_elem:
                 continue
 
-            category_name = title_elem.get_text(strip=True)
+            category_name = _node_text(title_elem)
 
             subcategories = []
-            sub_links = block.find_all(
-                "a",
-                class_="yv-dropdown-item-link"
-            )
+            sub_links = _css(block, _CSS_DROPDOWN_LINK)
 
             for link in sub_links:
-                name = link.get_text(strip=True)
-                href = link.get("href", "").strip()
+                name = _node_text(link)
+                href = _node_attr(link, "href").strip()
 
                 if not href.startswith("/collections/"):
                     continue
@@ -206,9 +414,12 @@ class LakshmiGroceryScraper:
         Returns:
             list: List of product dictionaries with details
         """
-        print(f"\n🛍️  Scraping products from: {collection_url}")
-        soup = self.get_page(collection_url)
-        
+        logger.info("🛍️  Scraping products from: %s", collection_url)
+        soup = self.get_tree(collection_url, PRODUCTS_STRAINER)
+        return self._parse_products(soup, collection_url, category_name, subcategory_name)
+
+    def _parse_products(self, soup, collection_url, category_name="", subcategory_name=""):
+        """Extract the product cards from a fetched collection page"""
         if not soup:
             print(f"❌ Failed to fetch {collection_url}")
             return []
@@ -216,49 +427,49 @@ class LakshmiGroceryScraper:
         products = []
         
         # Find the products container
-        products_container = soup.find("div", class_="row", attrs={"data-collection-products": ""})
+        products_container = _css_first(soup, _CSS_PRODUCTS)
         
         if not products_container:
             print("❌ Products container not found")
             return []
         
         # Find all product cards
-        product_cards = products_container.find_all("div", class_="col-6", attrs={"data-product-grid": ""})
+        product_cards = _css(products_container, _CSS_CARD)
         
-        print(f"[DEBUG] Found {len(product_cards)} product cards")
+        logger.debug("Found %d product cards", len(product_cards))
         
         for idx, card in enumerate(product_cards):
             try:
                 # Extract product information
-                product_info_div = card.find("div", class_="yv-product-information")
-                product_img_div = card.find("div", class_="yv-product-card-img")
+                product_info_div = _css_first(card, _CSS_CARD_INFO)
+                product_img_div = _css_first(card, _CSS_CARD_IMG)
                 
                 if not product_info_div:
                     continue
                 
                 # Product name
-                product_name_elem = product_info_div.find("a", class_="yv-product-title")
-                product_name = product_name_elem.get_text(strip=True) if product_name_elem else "N/A"
+                product_name_elem = _css_first(product_info_div, _CSS_TITLE)
+                product_name = _node_text(product_name_elem) if product_name_elem else "N/A"
                 
                 # Product URL - from the image link
                 product_url = "N/A"
                 if product_img_div:
-                    img_link = product_img_div.find("a", class_="yv-product-img")
+                    img_link = _css_first(product_img_div, _CSS_IMG_LINK)
                     if img_link:
-                        href = img_link.get("href", "").strip()
+                        href = _node_attr(img_link, "href").strip()
                         if href:
                             product_url = self.base_url + href if not href.startswith("http") else href
                 
                 # Price
-                price_elem = product_info_div.find("span", class_="product-price")
-                product_price = price_elem.get_text(strip=True) if price_elem else "N/A"
+                price_elem = _css_first(product_info_div, _CSS_PRICE)
+                product_price = _node_text(price_elem) if price_elem else "N/A"
                 
                 # Product image
-                img_elem = product_img_div.find("img") if product_img_div else None
-                product_image = img_elem.get("src", "N/A") if img_elem else "N/A"
+                img_elem = _css_first(product_img_div, "img") if product_img_div else None
+                product_image = _node_attr(img_elem, "src", "N/A") if img_elem else "N/A"
                 
                 # SKU or product ID (if available)
-                product_id = card.get("data-product-id", "N/A")
+                product_id = _node_attr(card, "data-product-id", "N/A")
                 
                 product_data = {
                     "name": product_name,
@@ -271,15 +482,95 @@ class LakshmiGroceryScraper:
                 }
                 
                 products.append(product_data)
-                print(f"   ✓ [{idx+1}] {product_name}")
+                logger.debug("   ✓ [%d] %s", idx + 1, product_name)
                 
             except Exception as e:
-                print(f"   ⚠️  Error parsing product {idx+1}: {e}")
+                logger.warning("   ⚠️  Error parsing product %d: %s", idx + 1, e)
                 continue
         
-        print(f"✅ Successfully scraped {len(products)} products")
+        logger.info("✅ Successfully scraped %d products", len(products))
         return products
     
+    # --------------------------------------------------
+    # SCRAPE PRODUCTS FROM THE COLLECTION JSON API
+    # --------------------------------------------------
+    def scrape_products_via_api(self, collection_slug, category_name="", subcategory_name=""):
+        """
+        Scrape all products of a collection from the Shopify products.json API
+        
+        Args:
+            collection_slug: Collection handle (as in /collections/<slug>)
+            category_name: Parent category name (for reference)
+            subcategory_name: Subcategory name (for reference)
+            
+        Returns:
+            list: Product dictionaries in the scrape_products format,
+                  or None if the API is unavailable for this collection
+        """
+        api_url = f"{self.base_url}/collections/{collection_slug}/products.json"
+        logger.info("🛍️  Scraping products from API: %s", api_url)
+        
+        products = []
+        page = 1
+        while True:
+            content = self._fetch(f"{api_url}?page={page}&limit={self.api_page_limit}")
+            batch = self._parse_api_products(content, category_name, subcategory_name)
+            if batch is None:
+                # A failure after the first page keeps what was fetched
+                return products if page > 1 else None
+            
+            products.extend(batch)
+            if len(batch) < self.api_page_limit:
+                break
+            page += 1
+        
+        logger.info("✅ Successfully scraped %d products", len(products))
+        return products
+
+    async def _ascrape_via_api(self, sem, session, api_url, category_name, subcategory_name):
+        """Async version of scrape_products_via_api"""
+        products = []
+        page = 1
+        while True:
+            content = await self._aget(sem, session, f"{api_url}?page={page}&limit={self.api_page_limit}")
+            batch = self._parse_api_products(content, category_name, subcategory_name)
+            if batch is None:
+                return products if page > 1 else None
+            
+            products.extend(batch)
+            if len(batch) < self.api_page_limit:
+                return products
+            page += 1
+
+    def _parse_api_products(self, content, category_name="", subcategory_name=""):
+        """Map one products.json page onto product dicts; None if it isn't valid JSON"""
+        if content is None:
+            return None
+        try:
+            payload = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return None
+        if not isinstance(payload, dict):
+            return None
+        
+        products = []
+        for item in payload.get("products", []):
+            variants = item.get("variants") or [{}]
+            images = item.get("images") or []
+            handle = item.get("handle")
+            price = variants[0].get("price")
+            
+            products.append({
+                "name": item.get("title") or "N/A",
+                "price": f"£{price}" if price else "N/A",
+                "url": f"{self.base_url}/products/{handle}" if handle else "N/A",
+                "image": images[0].get("src", "N/A") if images else "N/A",
+                "product_id": str(item["id"]) if item.get("id") is not None else "N/A",
+                "category": category_name,
+                "subcategory": subcategory_name,
+            })
+        return products
+
     # --------------------------------------------------
     # SCRAPE PRODUCT DETAILS FROM PRODUCT PAGE
     # --------------------------------------------------
@@ -287,9 +578,12 @@ class LakshmiGroceryScraper:
 # SCRAPE PRODUCT DETAILS FROM PRODUCT PAGE
 # --------------------------------------------------
     def scrape_product_details(self, product_url):
-        print(f"🔍 Fetching details from: {product_url}")
-        soup = self.get_page(product_url)
+        logger.debug("🔍 Fetching details from: %s", product_url)
+        soup = self.get_page(product_url, DETAILS_STRAINER)
+        return self._parse_product_details(soup, product_url)
 
+    def _parse_product_details(self, soup, product_url):
+        """Extract the description sections from a fetched product page"""
         details = {
             "description_html": "",
             "description_text": "",
@@ -302,31 +596,31 @@ class LakshmiGroceryScraper:
             print(f"❌ Failed to fetch product page: {product_url}")
             return details
 
-        accordion = soup.select_one("div.yv-product-accordion")
-        print(f"[DEBUG] Accordion section: {'Found' if accordion else 'Not Found'}")
+        accordion = soup.select_one(_CSS_ACCORDION)
+        logger.debug("Accordion section: %s", "Found" if accordion else "Not Found")
 
         if not accordion:
             # Try alternative selectors for product description
-            print("[DEBUG] Trying alternative selectors...")
+            logger.debug("Trying alternative selectors...")
 
             # Try finding description in other common locations
-            desc_div = soup.select_one("div.product-description")
+            desc_div = soup.select_one(_CSS_DESCRIPTION)
             if desc_div:
                 details["description_html"] = desc_div.decode_contents()
                 details["description_text"] = desc_div.get_text("\n", strip=True)
-                print(f"[DEBUG] Found description via alternative selector")
+                logger.debug("Found description via alternative selector")
 
             return details
 
-        for card in accordion.select("details.yv-accordion-card"):
-            title = card.select_one("summary h6")
+        for card in accordion.select(_CSS_ACCORDION_CARD):
+            title = card.select_one(_CSS_ACCORDION_TITLE)
             if not title:
                 continue
 
             section = title.get_text(strip=True).lower()
-            print(f"[DEBUG] Found section: {section}")
+            logger.debug("Found section: %s", section)
 
-            body = card.select_one("div.yv-content-body")
+            body = card.select_one(_CSS_ACCORDION_BODY)
             if not body:
                 continue
 
@@ -337,11 +631,12 @@ class LakshmiGroceryScraper:
                 details["description_html"] = html
                 details["description_text"] = text
 
-                if "allergy warning" in text.lower():
-                    details["allergy_warning"] = text.split("Allergy Warning:")[-1].split("Storage Advice")[0].strip()
+                match = _DESC_RE.search(text)
+                if match.group("allergy") is not None:
+                    details["allergy_warning"] = match.group("allergy").strip()
 
-                if "storage advice" in text.lower():
-                    details["storage_advice"] = text.split("Storage Advice:")[-1].strip()
+                if match.group("storage") is not None:
+                    details["storage_advice"] = match.group("storage").strip()
 
         return details
     # --------------------------------------------------
@@ -360,30 +655,38 @@ class LakshmiGroceryScraper:
             list: List of product dictionaries with details
         """
         
-        print(f"\n🛍️n🛍️n🛍️n🛍️n🛍️  Scraping products with details from: {collection_url}")
+        logger.info("🛍️  Scraping products with details from: %s", collection_url)
         # First, get basic product info from collection page
         products = self.scrape_products(collection_url, category_name, subcategory_name)
         
         # Then, fetch detailed info from each product page
-        print(f"\n📋 Fetching detailed info for {len(products)} products...")
+        logger.info("📋 Fetching detailed info for %d products...", len(products))
         
-        for idx, product in enumerate(products):
-            if product["url"] != "N/A":
-                print(f"   [Details {idx+1}/{len(products)}] {product['name']}")
-                product_details = self.scrape_product_details(product["url"])
-                product.update(product_details)
+        # requests releases the GIL while waiting on the socket, so the
+        # product pages are fetched on a thread pool sharing the session pool
+        with ThreadPoolExecutor(max_workers=self.detail_workers) as executor:
+            future_map = {}
+            for idx, product in enumerate(products):
+                if product["url"] != "N/A":
+                    logger.debug("   [Details %d/%d] %s", idx + 1, len(products), product["name"])
+                    future_map[executor.submit(self.scrape_product_details, product["url"])] = product
+            
+            for future in as_completed(future_map):
+                future_map[future].update(future.result())
         
         return products
     
     # --------------------------------------------------
     # SCRAPE ALL PRODUCTS FROM ALL CATEGORIES
     # --------------------------------------------------
-    def scrape_all_products(self, with_details=False):
+    def scrape_all_products(self, with_details=False, raw_stream_file=None):
         """
         Scrape products from all categories and subcategories
         
         Args:
             with_details: If True, fetch detailed info for each product (slower)
+            raw_stream_file: If given, each subcategory is appended to this
+                             JSON lines file as soon as it has been scraped
             
         Returns:
             dict: All products organized by category
@@ -392,37 +695,86 @@ class LakshmiGroceryScraper:
             print("❌ No grocery data found. Run get_grocery_navigation() first")
             return {}
         
+        return asyncio.run(self._scrape_all_products_async(with_details, raw_stream_file))
+
+    async def _scrape_all_products_async(self, with_details, raw_stream_file=None):
+        """Fetch every subcategory (and product page) concurrently on one aiohttp session"""
         all_products = {}
+        jobs = []
         
         for category in self.grocery_data["categories"]:
             category_name = category["category_name"]
             all_products[category_name] = {}
             
             for subcategory in category["subcategories"]:
-                subcategory_name = subcategory["name"]
-                subcategory_url = subcategory["url"]
-                
-                print(f"\n📂 {category_name} > {subcategory_name}")
-                
-                if with_details:
-                    print("🔎 Scraping with detailed product info...")
-                    products = self.scrape_products_with_details(
-                        subcategory_url,
-                        category_name,
-                        subcategory_name
-                    )
-                else:
-                    print("🔎 Scraping without detailed product info...")
-                    products = self.scrape_products(
-                        subcategory_url,
-                        category_name,
-                        subcategory_name
+                jobs.append((category_name, subcategory["name"], subcategory))
+        
+        print(f"🔎 Scraping {len(jobs)} subcategories "
+              f"{'with' if with_details else 'without'} detailed product info...")
+        
+        sem = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=self.per_host_limit)
+        timeout = aiohttp.ClientTimeout(total=30)
+        # Carry over the age-verification cookie set on the requests session
+        cookies = {cookie.name: cookie.value for cookie in self.session.cookies}
+        
+        raw_stream_cm = open(raw_stream_file, "wb") if raw_stream_file else contextlib.nullcontext()
+        
+        with raw_stream_cm as raw_stream:
+            async with aiohttp.ClientSession(
+                headers=self.headers, cookies=cookies, connector=connector, timeout=timeout
+            ) as session:
+                results = await asyncio.gather(*[
+                    self._scrape_collection(
+                        sem, session, subcategory, category_name, subcategory_name, with_details, raw_stream
                     )
-                
-                all_products[category_name][subcategory_name] = products
+                    for category_name, subcategory_name, subcategory in jobs
+                ])
+        
+        for (category_name, subcategory_name, _), products in zip(jobs, results):
+            all_products[category_name][subcategory_name] = products
         
         return all_products
 
+    async def _scrape_collection(self, sem, session, subcategory, category_name,
+                                 subcategory_name, with_details, raw_stream=None):
+        """Async version of scrape_products / scrape_products_with_details"""
+        # The collection's products.json needs no HTML parsing at all; the
+        # HTML page is only scraped when the API isn't available
+        products = None
+        if subcategory.get("products_api"):
+            products = await self._ascrape_via_api(
+                sem, session, subcategory["products_api"], category_name, subcategory_name
+            )
+        logger.info("📂 %s > %s", category_name, subcategory_name)
+        
+        if products is None:
+            collection_url = subcategory["url"]
+            content = await self._aget(sem, session, collection_url)
+            soup = self._make_tree(content, PRODUCTS_STRAINER) if content is not None else None
+            products = self._parse_products(soup, collection_url, category_name, subcategory_name)
+        else:
+            logger.info("✅ Successfully scraped %d products via API", len(products))
+        
+        if with_details:
+            detailed = [product for product in products if product["url"] != "N/A"]
+            pages = await asyncio.gather(*[
+                self._aget(sem, session, product["url"]) for product in detailed
+            ])
+            for product, page in zip(detailed, pages):
+                soup = BeautifulSoup(page, HTML_PARSER, parse_only=DETAILS_STRAINER) if page is not None else None
+                product.update(self._parse_product_details(soup, product["url"]))
+        
+        if raw_stream is not None:
+            # Coroutines share one thread, so lines are never interleaved
+            raw_stream.write(orjson.dumps({
+                "category": category_name,
+                "subcategory": subcategory_name,
+                "products": products,
+            }, option=orjson.OPT_NON_STR_KEYS) + b"\n")
+        
+        return products
+
     # --------------------------------------------------
     # CLEAN PRODUCTS
     # --------------------------------------------------
@@ -446,31 +798,40 @@ class LakshmiGroceryScraper:
         
         # Flatten if nested structure (category/subcategory)
         products_list = []
-        if isinstance(all_products, dict):
-            # Nested structure: {category: {subcategory: [products]}}
-            for category, subcats in all_products.items():
-                if isinstance(subcats, dict):
-                    for subcat, products in subcats.items():
-                        if isinstance(products, list):
-                            for product in products:
-                                product['category'] = category
-                                product['subcategory'] = subcat
-                                products_list.append(product)
-                else:
-                    products_list.extend(subcats if isinstance(subcats, list) else [subcats])
-        else:
-            products_list = all_products if isinstance(all_products, list) else [all_products]
+        for category, subcategory, product in _iter_products(all_products):
+            if subcategory is not None:
+                product['category'] = category
+                product['subcategory'] = subcategory
+            products_list.append(product)
         
-        # Process through integrated cleaner
+        # Clean every product name in one vectorised pandas pass up front;
+        # the per-product cleaner below then reads them from its cache
+        self.product_cleaner.normalizer.clean_product_names([
+            raw_product.get('name') or raw_product.get('Product Name', '')
+            for raw_product in products_list
+        ])
+        
+        # Process through integrated cleaner. A product listed under several
+        # subcategories is identical apart from the subcategory, which the
+        # cleaner doesn't read, so each distinct product is normalized once
         cleaned_products = []
+        normalized_cache = {}
         for i, raw_product in enumerate(products_list, 1):
             try:
                 # Clean and normalize the product
-                cleaned_product = self.product_cleaner.clean_and_normalize_product(raw_product)
+                key = orjson.dumps(
+                    {k: v for k, v in raw_product.items() if k != 'subcategory'},
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                )
+                normalized = normalized_cache.get(key)
+                if normalized is None:
+                    normalized = self.product_cleaner.clean_and_normalize_product(raw_product)
+                    normalized_cache[key] = normalized
                 
-                # Add source metadata
+                # Add source metadata (per occurrence, so each keeps its own
+                # timestamp and generated Product ID)
                 cleaned_product = self.product_cleaner.add_source_metadata(
-                    cleaned_product,
+                    dict(normalized),
                     source_name="Lakshmi Wholesale",
                     source_url="https://www.lakshmiwholesale.com"
                 )
@@ -498,46 +859,12 @@ class LakshmiGroceryScraper:
         Export cleaned products to CSV file
         
         Args:
-            all_products: Dict with structure {category: {subcategory: [products]}}
+            all_products: Dict with structure {category: {subcategory: [products]}},
+                          or a flat list of products
             filename: Output CSV filename
         """
         print(f"\n💾 Exporting to CSV: {filename}")
         
-        # Flatten all products into a single list
-        all_products_flat = []
-        
-        for category, subcategories in all_products.items():
-            for subcategory, products in subcategories.items():
-                for product in products:
-                    # Flatten nested structures for CSV
-                    flattened_product = {
-                        'product_id': product.get('product_id', ''),
-                        'name': product.get('name', ''),
-                        'cleaned_name': product.get('cleaned_name', ''),
-                        'price': product.get('price', ''),
-                        'brand': product.get('brand', ''),
-                        'category': product.get('category', ''),
-                        'subcategory': product.get('subcategory', ''),
-                        'volume_weight': product.get('volume_weight', ''),
-                        'is_multipack': product.get('is_multipack', False),
-                        'product_type': product.get('product_type', ''),
-                        'url': product.get('url', ''),
-                        'image_url': product.get('image_url', ''),
-                        'slug': product.get('slug', ''),
-                        'allergens': ', '.join(product.get('allergens', [])) if product.get('allergens') else '',
-                        'certifications': ', '.join(product.get('certifications', [])) if product.get('certifications') else '',
-                        'ingredients': product.get('ingredients', ''),
-                        'country_of_origin': product.get('country_of_origin', ''),
-                        'storage_advice': product.get('storage_advice', ''),
-                        'allergy_warning': product.get('allergy_warning', ''),
-                        'description': product.get('description', ''),
-                    }
-                    all_products_flat.append(flattened_product)
-        
-        if not all_products_flat:
-            print("❌ No products to export")
-            return
-        
         # Define CSV headers
         headers = [
             'product_id', 'name', 'cleaned_name', 'price', 'brand', 'category',
@@ -546,14 +873,61 @@ class LakshmiGroceryScraper:
             'country_of_origin', 'storage_advice', 'allergy_warning', 'description'
         ]
         
+        # Flatten all products into rows (tuples in header order), produced
+        # lazily so the flattened copy is never held in memory
+        rows = (
+            (
+                product.get('product_id', ''),
+                product.get('name', ''),
+                product.get('cleaned_name', ''),
+                product.get('price', ''),
+                product.get('brand', ''),
+                product.get('category', ''),
+                product.get('subcategory', ''),
+                product.get('volume_weight', ''),
+                product.get('is_multipack', False),
+                product.get('product_type', ''),
+                product.get('url', ''),
+                product.get('image_url', ''),
+                product.get('slug', ''),
+                ', '.join(product.get('allergens', [])) if product.get('allergens') else '',
+                ', '.join(product.get('certifications', [])) if product.get('certifications') else '',
+                product.get('ingredients', ''),
+                product.get('country_of_origin', ''),
+                product.get('storage_advice', ''),
+                product.get('allergy_warning', ''),
+                product.get('description', ''),
+            )
+            for _, _, product in _iter_products(all_products)
+        )
+        
+        if pd is not None:
+            df = pd.DataFrame.from_records(rows, columns=headers)
+            if df.empty:
+                print("❌ No products to export")
+                return
+        else:
+            first_row = next(rows, None)
+            if first_row is None:
+                print("❌ No products to export")
+                return
+            rows = itertools.chain((first_row,), rows)
+        
         # Write to CSV
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=headers)
-                writer.writeheader()
-                writer.writerows(all_products_flat)
+            if pd is not None:
+                # Same line endings as the csv module
+                df.to_csv(filename, index=False, encoding='utf-8', lineterminator='\r\n')
+                row_count = len(df)
+            else:
+                with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(headers)
+                    row_count = 0
+                    for row_count, row in enumerate(rows, 1):
+                        writer.writerow(row)
             
-            print(f"✅ Successfully exported {len(all_products_flat)} products to {filename}")
+            print(f"✅ Successfully exported {row_count} products to {filename}")
         except Exception as e:
             print(f"❌ Error exporting to CSV: {e}")
 
@@ -565,21 +939,17 @@ class LakshmiGroceryScraper:
         Save cleaned products to JSON file
         
         Args:
-            cleaned_products: Dict with cleaned products
+            cleaned_products: Cleaned products (flat list or nested dict)
             filename: Output JSON filename
         """
         print(f"\n💾 Saving cleaned products to JSON: {filename}")
         
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(cleaned_products, f, indent=2, ensure_ascii=False)
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(cleaned_products, option=_JSON_OPTIONS))
             
             # Count total products
-            total_products = sum(
-                len(products)
-                for subcategories in cleaned_products.values()
-                for products in subcategories.values()
-            )
+            total_products = sum(1 for _ in _iter_products(cleaned_products))
             
             print(f"✅ Successfully saved {total_products} cleaned products to {filename}")
         except Exception as e:
@@ -625,14 +995,19 @@ class LakshmiGroceryScraper:
         print("\n" + "=" * 70)
         print("STEP 2: SCRAPING RAW PRODUCTS")
         print("=" * 70)
-        all_products = self.scrape_all_products(with_details=with_details)
+        all_products = self.scrape_all_products(
+            with_details=with_details,
+            raw_stream_file="all_products.jsonl"
+        )
         
         # ======================================================
         # PHASE 1: SAVE RAW PRODUCTS (Before cleaning)
         # ======================================================
+        # all_products.jsonl was already streamed while scraping; this
+        # nested copy is what the merge step in scraper_runner reads
         raw_file = "all_products.json"
-        with open(raw_file, "w", encoding="utf-8") as f:
-            json.dump(all_products, f, indent=2, ensure_ascii=False)
+        with open(raw_file, "wb") as f:
+            f.write(orjson.dumps(all_products, option=_JSON_OPTIONS))
         print(f"\n📁 Raw products saved: {raw_file}")
         
         # ======================================================
@@ -689,8 +1064,8 @@ class LakshmiGroceryScraper:
             print("❌ Nothing to save")
             return
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(self.grocery_data, f, indent=2, ensure_ascii=False)
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(self.grocery_data, option=_JSON_OPTIONS))
 
         print(f"💾 Saved navigation to {filename}")
 
@@ -709,16 +1084,16 @@ class LakshmiGroceryScraper:
         # Load existing brands if file exists
         existing_brands = []
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                existing_brands = json.load(f)
+            with open(filename, "rb") as f:
+                existing_brands = orjson.loads(f.read())
         except FileNotFoundError:
             pass
 
         # Merge new brands with existing ones
         all_brands = sorted(list(set(existing_brands + brands)))
         
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(all_brands, f, indent=2, ensure_ascii=False)
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(all_brands, option=_JSON_OPTIONS))
 
         print(f"💾 Saved {len(all_brands)} brands to {filename}")
         print(f"   ({len(brands)} new brands added)")
@@ -730,6 +1105,7 @@ class LakshmiGroceryScraper:
 # ==================================================
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     scraper = LakshmiGroceryScraper()
     
     # Run the complete pipeline: scrape, clean, and export
@@ -739,6 +1115,7 @@ if __name__ == "__main__":
         print("\n✅ All tasks completed successfully!")
         print("📁 Output files:")
         print("   - all_products.json (raw scraped data)")
+        print("   - all_products.jsonl (raw data, one subcategory per line)")
         print("   - grocery_navigation.json (navigation structure)")
         print("   - brands.json (brands list)")
         print("   - clean_laxmi.json (cleaned products - JSON)")
@@ -1,12 +1,23 @@
-from DrissionPage import ChromiumPage
-from bs4 import BeautifulSoup
-import json
+from DrissionPage import ChromiumOptions, ChromiumPage
+import aiohttp
+from lxml import etree, html as lxml_html
+from lxml.html import soupparser
+from cssselect import HTMLTranslator
+import asyncio
+import contextlib
+import functools
+import orjson
 import time
 import random
 import re
 import os
 import logging
-from typing import List, Dict, Optional
+import queue
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, List, Dict, Optional
 from urllib.parse import urljoin
 
 
@@ -17,90 +28,313 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Title patterns, compiled once for every product scraped
+_PRICE_PATTERNS = [
+    re.compile(r'[Pp][Mm][Pp]?\s*£(\d+\.?\d*)'),
+    re.compile(r'£(\d+\.?\d*)\s*[Pp][Mm][Pp]?'),
+    re.compile(r'[Pp]\.?[Mm]\.?\s*£(\d+\.?\d*)'),
+]
+_VOLUME_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(\d+\s*x\s*\d+(?:\.\d+)?\s*(?:ml|g|l|kg))',
+        r'(\d+(?:\.\d+)?\s*(?:ml|l|litre|liter)s?)',
+        r'(\d+(?:\.\d+)?\s*(?:g|kg|gram|kilogram)s?)',
+        r'(\d+\s*(?:pk|pack))',
+    )
+]
+# Price-marked and multipack markers in one alternation; the group that matched names the type
+_TYPE_RE = re.compile(
+    r'(?P<pmp>\bp\.?m\.?p?\b|pm\s*£|pmp\s*£|£\d+\.?\d*\s*pm)'
+    r'|(?P<multi>\d+\s*x\s*\d+|\d+\s*(?:pk|pack)\b)',
+    re.IGNORECASE
+)
+
+# Hints that a candidate listing element is a product card
+_PROBE_RE = re.compile(r'£|\d+\s*(?:ml|g|kg)|buy|basket', re.IGNORECASE)
+_PROBE_LIMIT = 2000
+
+_CSS_TRANSLATOR = HTMLTranslator()
+
+# Column-store filler for fields a product doesn't have (detail sections vary
+# per product), so they're left out again rather than written as null
+_MISSING = object()
+
+# Only the markup is scraped; <img src> is read from the HTML, never downloaded
+_BLOCKED_URLS = (
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.ttf',
+    '*google-analytics*', '*googletagmanager*',
+)
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+@functools.lru_cache(maxsize=None)
+def _css(selector: str) -> etree.XPath:
+    """CSS selector compiled to XPath once; matches descendants only, like BS4's select()"""
+    return etree.XPath(_CSS_TRANSLATOR.css_to_xpath(selector, prefix='descendant::'))
+
+
+def _select(element, selector: str) -> list:
+    return _css(selector)(element)
+
+
+def _select_one(element, selector: str):
+    matches = _css(selector)(element)
+    return matches[0] if matches else None
+
+
+def _get_text(element, separator: str = '') -> str:
+    """Element text like BS4's get_text(separator, strip=True)"""
+    return separator.join(text for text in (s.strip() for s in element.itertext()) if text)
+
+
+def _probe_text(element, limit: int = _PROBE_LIMIT) -> str:
+    """Leading text of an element, like _get_text() but stopping after limit characters"""
+    pieces = []
+    size = 0
+    for text in element.itertext():
+        text = text.strip()
+        if text:
+            pieces.append(text)
+            size += len(text)
+            if size >= limit:
+                break
+    return ''.join(pieces)[:limit]
+
+
+def _parse_html(html_content: str) -> lxml_html.HtmlElement:
+    try:
+        return lxml_html.fromstring(html_content)
+    except (etree.ParserError, ValueError):
+        # BeautifulSoup copes with markup lxml rejects, still building an lxml tree
+        return soupparser.fromstring(html_content)
+
+
+# Title extractors are pure, so repeated titles across pages are answered from cache
+
+@functools.lru_cache(maxsize=4096)
+def extract_price_from_title(title: str) -> Optional[str]:
+    """Extract price from product title"""
+    for pattern in _PRICE_PATTERNS:
+        match = pattern.search(title)
+        if match:
+            return f"£{match.group(1)}"
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def extract_volume_weight(title: str) -> Optional[str]:
+    """Extract volume or weight from title"""
+    for pattern in _VOLUME_PATTERNS:
+        match = pattern.search(title)
+        if match:
+            return match.group(1)
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def detect_product_type(title: str) -> str:
+    """Detect product type from title"""
+    product_type = "regular"
+    
+    # A price mark anywhere wins over an earlier multipack marker
+    for match in _TYPE_RE.finditer(title):
+        if match.lastgroup == 'pmp':
+            return "price_marked"
+        product_type = "multipack"
+    
+    return product_type
+
+
+class RateLimiter:
+    """Spaces calls to wait() at least min_interval seconds apart across all threads"""
+    
+    def __init__(self, min_interval: float):
+        self.interval = min_interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+    
+    def wait(self):
+        # Reserve the next slot under the lock, sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._next - now)
+            self._next = max(now, self._next) + self.interval
+        if delay:
+            logger.debug("Waiting %.2f seconds...", delay)
+            time.sleep(delay)
+
+
+class BrowserPool:
+    """Tabs of one Chromium browser, so every tab shares the Cloudflare clearance"""
+    
+    def __init__(self, size: int = 4, recycle_after: int = 100,
+                 options: Optional[ChromiumOptions] = None, blocked_urls: tuple = ()):
+        self.size = size
+        self.recycle_after = recycle_after
+        self.blocked_urls = list(blocked_urls)
+        self.browser = ChromiumPage(options) if options is not None else ChromiumPage()
+        # (tab, pages fetched) pairs
+        self._tabs = queue.Queue()
+        for _ in range(size):
+            self._tabs.put((self._new_tab(), 0))
+    
+    def _new_tab(self):
+        tab = self.browser.new_tab()
+        if self.blocked_urls:
+            tab.set.blocked_urls(self.blocked_urls)
+        return tab
+    
+    @contextlib.contextmanager
+    def acquire(self):
+        """Borrow a tab, blocking until one is free; tabs are replaced after recycle_after pages to bound memory"""
+        tab, uses = self._tabs.get()
+        try:
+            yield tab
+        finally:
+            uses += 1
+            if uses >= self.recycle_after:
+                logger.debug("♻️ Recycling browser tab")
+                tab.close()
+                tab, uses = self._new_tab(), 0
+            self._tabs.put((tab, uses))
+    
+    def quit(self):
+        self.browser.quit()
+
 
 class Product_Scraper:
     """Scraper using cloudscraper to bypass Cloudflare"""
     
     BASE_URL = "https://www.wegetanystock.com/grocery"
+    # Root-relative hrefs resolve against the origin, not BASE_URL's /grocery path
+    SITE_URL = "https://www.wegetanystock.com"
+    COOKIE_DOMAIN = "wegetanystock.com"
     
     # CATEGORY_URLS = [
     #     "/grocery",
     # ]
     
+    # Selector cascades, tried in order; _css() compiles each to XPath once
+    _NAME_SELECTORS = (
+        '.card__heading a',
+        '.product-card__title',
+        '.product-title a',
+        'h3 a',
+        'h2 a',
+        '.card__heading',
+        'a.full-unstyled-link',
+    )
+    _IMG_SELECTORS = (
+        'img.motion-reduce',
+        '.card__media img',
+        'img[src*="cdn.shopify"]',
+        'img',
+    )
+    _LINK_SELECTOR = 'a[href*="/products/"]'
+    _PRODUCT_SELECTORS = (
+        ('article[class*="text-gray"]', 'article with text-gray class'),
+        ('article', 'all article tags'),
+        ('div[class*="product-card"]', 'product-card divs'),
+        ('.grid-item', 'grid-item class'),
+        ('div[class*="col"]', 'column divs'),
+        ('a.full-unstyled-link', 'full-unstyled-link anchors'),
+    )
+    
     def __init__(self, delay_range: tuple = (2, 5)):
         
         self.delay_range = delay_range
-        self.page = None
-        self.products = []
+        # Every request, HTTP or browser, shares one politeness budget
+        self.rate_limiter = RateLimiter(min_interval=delay_range[0])
+        self.pool = None
+        self.pool_size = 4
+        self.recycle_tabs_after = 100
+        # Seconds to wait for the Cloudflare challenge to clear
+        self.cf_timeout = 45
+        # Parallel plain-HTTP requests once the browser has cleared Cloudflare
+        self.http_concurrency = 4
+        self._browser_executor = None
+        # Scraped products stored column-wise: field -> list of values, each
+        # length product_count (fields a product lacks are _MISSING)
+        self.cols = defaultdict(list)
+        self.product_count = 0
         logger.info("🚀 Initializing DrissionPage for Cloudflare bypass")
     
     def start_browser(self):
         
-        if self.page is None:
-            logger.info("🚀 Starting ChromiumPage browser...")
-            self.page = ChromiumPage()
+        if self.pool is None:
+            logger.info(f"🚀 Starting ChromiumPage browser with {self.pool_size} tabs...")
+            co = ChromiumOptions()
+            co.set_pref('profile.managed_default_content_settings.images', 2)
+            co.set_argument('--blink-settings=imagesEnabled=false')
+            self.pool = BrowserPool(
+                self.pool_size,
+                recycle_after=self.recycle_tabs_after,
+                options=co,
+                blocked_urls=_BLOCKED_URLS,
+            )
             logger.info("✅ Browser started successfully")
     
     def close_browser(self):
         
-        if self.page:
+        if self.pool:
             logger.info("🔒 Closing browser...")
-            self.page.quit()
-            self.page = None
-    
-    def random_delay(self):
-        """Add random delay to mimic human behavior"""
-        delay = random.uniform(*self.delay_range)
-        logger.debug(f"Waiting {delay:.2f} seconds...")
-        time.sleep(delay)
+            self.pool.quit()
+            self.pool = None
     
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    def fetch_page(self, url: str) -> Optional[lxml_html.HtmlElement]:
         """Fetch and parse a page using DrissionPage"""
         try:
             logger.info(f"📄 Fetching: {url}")
             
             
-            if self.page is None:
+            if self.pool is None:
                 self.start_browser()
             
-           
-            self.page.get(url)
-            logger.debug(f"Initial title: {self.page.title}")
-            
-            
-            logger.debug("⏳ Waiting for Cloudflare bypass...")
-            max_waits = 15  
-            wait_count = 0
+            # Title, snippet and body diagnostics cost browser round-trips and
+            # DOM serialization, so only gather them when DEBUG is on
+            debug = logger.isEnabledFor(logging.DEBUG)
             
-            while "Just a moment" in self.page.title and wait_count < max_waits:
-                logger.debug(f"Waiting for Cloudflare... (attempt {wait_count + 1}/{max_waits})")
-                time.sleep(3)
-                wait_count += 1
-            
-            if "Just a moment" in self.page.title:
-                logger.warning("⚠️ Still showing Cloudflare challenge after waiting")
-            else:
-                logger.debug(f"✅ Cloudflare bypassed. Current title: {self.page.title}")
-            
-          
-            time.sleep(2)
-            
-            html_content = self.page.html
-            logger.debug(f"Page HTML length: {len(html_content)} characters")
-            logger.debug(f"HTML snippet (first 500 chars): {html_content[:500]}")
+            with self.pool.acquire() as page:
+                self.rate_limiter.wait()
+                page.get(url)
+                page.wait.doc_loaded()
+                if debug:
+                    logger.debug("Initial title: %s", page.title)
+                
+                
+                if "Just a moment" in page.title:
+                    logger.debug("⏳ Waiting for Cloudflare bypass...")
+                    # Returns as soon as the challenge title goes away
+                    page.wait.title_change("Just a moment", exclude=True, timeout=self.cf_timeout)
+                    page.wait.doc_loaded()
+                
+                title = page.title
+                if "Just a moment" in title:
+                    logger.warning("⚠️ Still showing Cloudflare challenge after waiting")
+                else:
+                    logger.debug("✅ Cloudflare bypassed. Current title: %s", title)
+                
+                html_content = page.html
+            logger.debug("Page HTML length: %d characters", len(html_content))
+            if debug:
+                logger.debug("HTML snippet (first 500 chars): %s", html_content[:500])
             
             if "Just a moment" in html_content or len(html_content) < 1000:
                 logger.warning("⚠️ Page might not have loaded properly")
             
-            soup = BeautifulSoup(html_content, 'lxml')
+            soup = _parse_html(html_content)
             
             
-            body_tag = soup.select_one('body')
-            if body_tag:
-                logger.debug(f"Body tag found, content length: {len(str(body_tag))} characters")
-                logger.debug(f"Body content snippet: {str(body_tag)[:300]}")
+            if debug:
+                body_tag = _select_one(soup, 'body')
+                if body_tag is not None:
+                    body_html = lxml_html.tostring(body_tag, encoding=str)
+                    logger.debug("Body tag found, content length: %d characters", len(body_html))
+                    logger.debug("Body content snippet: %s", body_html[:300])
             
-            logger.info(f"✅ Page loaded successfully: {self.page.title}")
+            logger.info(f"✅ Page loaded successfully: {title}")
             
             
             
@@ -110,41 +344,84 @@ class Product_Scraper:
             logger.error(f"❌ Error fetching {url}: {e}")
             return None
     
+    def _browser_cookies(self) -> Dict[str, str]:
+        """Cookies from the browser session, including Cloudflare's cf_clearance"""
+        # The root tab never navigates (fetches run in pooled tabs), so its
+        # current-URL cookies are empty; read every domain and keep the site's
+        return {
+            cookie['name']: cookie['value']
+            for cookie in self.pool.browser.cookies(all_domains=True)
+            if cookie.get('domain', '').lstrip('.').endswith(self.COOKIE_DOMAIN)
+        }
+    
+    def _http_headers(self) -> Dict[str, str]:
+        # cf_clearance is bound to the User-Agent that solved the challenge
+        return {
+            'User-Agent': self.pool.browser.user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-GB,en;q=0.9',
+        }
+    
+    async def _afetch_page(self, session: aiohttp.ClientSession, sem: asyncio.Semaphore,
+                           url: str) -> Optional[lxml_html.HtmlElement]:
+        """Fetch and parse a page over HTTP, falling back to the browser when Cloudflare challenges"""
+        html_content, status = "", None
+        try:
+            async with sem:
+                # Same politeness budget as the browser tabs
+                await asyncio.to_thread(self.rate_limiter.wait)
+                async with session.get(url) as response:
+                    status = response.status
+                    html_content = await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug("HTTP fetch failed for %s: %s", url, e)
+        
+        if status == 200 and "Just a moment" not in html_content:
+            logger.info(f"📄 Fetched: {url}")
+            return _parse_html(html_content)
+        
+        logger.info(f"🛡️ Challenged on {url} (status {status}), falling back to browser")
+        # One worker thread per pooled tab
+        loop = asyncio.get_running_loop()
+        soup = await loop.run_in_executor(self._browser_executor, self.fetch_page, url)
+        session.cookie_jar.update_cookies(self._browser_cookies())
+        return soup
+    
     def extract_brands_from_dropdown(self) -> List[str]:
         logger.info("🔍 Extracting brands from Brands dropdown")
 
         soup = self.fetch_page(self.BASE_URL)
         # print("@@@@@",soup)
-        if not soup:
+        if soup is None:
             return []
 
         brands = []
 
         # 1️⃣ Find all dropdown containers
-        dropdown_containers = soup.select('div[x-data]')
+        dropdown_containers = _select(soup, 'div[x-data]')
 
         brands_container = None
 
         for container in dropdown_containers:
-            p = container.select_one('div > p')
-            if p and p.get_text(strip=True).lower() == "brands":
+            p = _select_one(container, 'div > p')
+            if p is not None and _get_text(p).lower() == "brands":
                 brands_container = container
                 break
 
-        if not brands_container:
+        if brands_container is None:
             logger.warning("❌ Brands dropdown container not found")
             return []
 
         # 2️⃣ Find the <ul> inside this container
-        ul = brands_container.select_one('ul[x-show="open"]')
+        ul = _select_one(brands_container, 'ul[x-show="open"]')
 
-        if not ul:
+        if ul is None:
             logger.warning("❌ Brands <ul> not found inside container")
             return []
 
         # 3️⃣ Extract brand names
-        for li in ul.select('li'):
-            brand = li.get_text(strip=True)
+        for li in _select(ul, 'li'):
+            brand = _get_text(li)
             if brand:
                 brands.append(brand)
 
@@ -154,77 +431,74 @@ class Product_Scraper:
         return brands
 
     def save_brands(self, brands: List[str], filepath: str):
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(brands, f, indent=2, ensure_ascii=False)
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(brands, option=_JSON_OPTIONS))
 
         logger.info(f"💾 Saved {len(brands)} brands to {filepath}")
 
 
-    def extract_price_from_title(self, title: str) -> Optional[str]:
-        """Extract price from product title"""
-        patterns = [
-            r'[Pp][Mm][Pp]?\s*£(\d+\.?\d*)',
-            r'£(\d+\.?\d*)\s*[Pp][Mm][Pp]?',
-            r'[Pp]\.?[Mm]\.?\s*£(\d+\.?\d*)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, title)
-            if match:
-                return f"£{match.group(1)}"
-        return None
-    
     def extract_product_page_details(self, product_url: str) -> Dict:
         """
         Extract Ingredients, Safety Warning, Nutrition table, etc.
         from product page <details> sections
         """
-        data = {}
-
         soup = self.fetch_page(product_url)
-        if not soup:
-            return data
+        if soup is None:
+            return {}
+        return self._parse_product_page(soup)
+
+    async def _aextract_product_page_details(self, session: aiohttp.ClientSession,
+                                             sem: asyncio.Semaphore, product_url: Optional[str]) -> Dict:
+        if not product_url:
+            return {}
+        soup = await self._afetch_page(session, sem, product_url)
+        if soup is None:
+            return {}
+        return self._parse_product_page(soup)
+
+    def _parse_product_page(self, soup: lxml_html.HtmlElement) -> Dict:
+        data = {}
 
         # Find all <details> blocks
-        details_blocks = soup.select("details")
+        details_blocks = _select(soup, "details")
 
         nutrition_data = {}
 
         for block in details_blocks:
-            summary = block.select_one("summary")
-            if not summary:
+            summary = _select_one(block, "summary")
+            if summary is None:
                 continue
 
-            section_title = summary.get_text(strip=True).lower()
+            section_title = _get_text(summary).lower()
 
             # -----------------------
             # INGREDIENTS
             # -----------------------
             if "ingredient" in section_title:
-                p = block.select_one("p")
-                if p:
-                    data["Ingredients List"] = p.get_text(" ", strip=True)
+                p = _select_one(block, "p")
+                if p is not None:
+                    data["Ingredients List"] = _get_text(p, " ")
 
             # -----------------------
             # SAFETY WARNING
             # -----------------------
             elif "safety" in section_title:
-                p = block.select_one("p")
-                if p:
-                    data["Safety Warning"] = p.get_text(" ", strip=True)
+                p = _select_one(block, "p")
+                if p is not None:
+                    data["Safety Warning"] = _get_text(p, " ")
 
             # -----------------------
             # NUTRITION TABLE
             # -----------------------
             elif "nutrition" in section_title:
-                rows = block.select("table tr")
+                rows = _select(block, "table tr")
 
                 for row in rows:
-                    cols = row.select("td, th")
+                    cols = _select(row, "td, th")
                     if len(cols) >= 2:
-                        key = cols[0].get_text(" ", strip=True)
-                        value = cols[1].get_text(" ", strip=True)
+                        key = _get_text(cols[0], " ")
+                        value = _get_text(cols[1], " ")
                         nutrition_data[key] = value
 
         # Flatten nutrition into main dict
@@ -233,74 +507,54 @@ class Product_Scraper:
 
         return data
 
-    def extract_volume_weight(self, title: str) -> Optional[str]:
-        """Extract volume or weight from title"""
-        patterns = [
-            r'(\d+\s*x\s*\d+(?:\.\d+)?\s*(?:ml|g|l|kg))',
-            r'(\d+(?:\.\d+)?\s*(?:ml|l|litre|liter)s?)',
-            r'(\d+(?:\.\d+)?\s*(?:g|kg|gram|kilogram)s?)',
-            r'(\d+\s*(?:pk|pack))',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        return None
-    
-    def detect_product_type(self, title: str) -> str:
-        """Detect product type from title"""
-        title_lower = title.lower()
-        
-        if re.search(r'\bp\.?m\.?p?\b', title_lower) or re.search(r'pm\s*£|pmp\s*£|£\d+\.?\d*\s*pm', title_lower):
-            return "price_marked"
-        
-        if re.search(r'\d+\s*x\s*\d+', title_lower) or re.search(r'\d+\s*(?:pk|pack)\b', title_lower):
-            return "multipack"
+    def _product_url(self, product_element) -> Optional[str]:
+        """Absolute product page URL of a listing element, if it links to one"""
+        link_elem = _select_one(product_element, self._LINK_SELECTOR)
+        if link_elem is None:
+            return None
         
-        return "regular"
+        # Shopify hrefs are almost always absolute or root-relative; skip urljoin's full parse for those
+        href = link_elem.get('href') or ''
+        if href.startswith(('https://', 'http://')):
+            return href
+        if href.startswith('/') and not href.startswith('//'):
+            return self.SITE_URL + href
+        return urljoin(self.BASE_URL, href)
     
     def extract_product_data(self, product_element) -> Optional[Dict]:
         """Extract data from a product element"""
+        return self._extract_product_data(product_element, self._product_url(product_element))
+    
+    def _extract_product_data(self, product_element, product_url: Optional[str]) -> Optional[Dict]:
         try:
             product = {}
-            logger.debug(f"Extracting product from element: {product_element.name}")
-            
+            logger.debug("Extracting product from element: %s", product_element.tag)
             
-            name_selectors = [
-                '.card__heading a',
-                '.product-card__title',
-                '.product-title a',
-                'h3 a',
-                'h2 a',
-                '.card__heading',
-                'a.full-unstyled-link',
-            ]
             
             name = None
-            for selector in name_selectors:
+            for selector in self._NAME_SELECTORS:
                 try:
-                    name_elem = product_element.select_one(selector)
-                    if name_elem:
-                        name = name_elem.get_text(strip=True)
-                        logger.debug(f"Found name with '{selector}': {name[:50]}")
+                    name_elem = _select_one(product_element, selector)
+                    if name_elem is not None:
+                        name = _get_text(name_elem)
+                        logger.debug("Found name with '%s': %.50s", selector, name)
                         if name and len(name) > 3:
                             break
                 except Exception as e:
-                    logger.debug(f"Error with selector '{selector}': {e}")
+                    logger.debug("Error with selector '%s': %s", selector, e)
                     continue
             
             if not name:
                 logger.debug("Trying fallback: searching all links")
                 
-                links = product_element.select('a')
-                logger.debug(f"Found {len(links)} links in element")
+                links = _select(product_element, 'a')
+                logger.debug("Found %d links in element", len(links))
                 for i, link in enumerate(links):
-                    text = link.get_text(strip=True)
-                    logger.debug(f"Link {i}: {text[:50]}")
+                    text = _get_text(link)
+                    logger.debug("Link %d: %.50s", i, text)
                     if text and len(text) > 5:
                         name = text
-                        logger.debug(f"Selected fallback name: {name[:50]}")
+                        logger.debug("Selected fallback name: %.50s", name)
                         break
             
             if not name:
@@ -308,21 +562,14 @@ class Product_Scraper:
                 return None
             
             product['name'] = name
-            product['price'] = self.extract_price_from_title(name)
-            product['volume_weight'] = self.extract_volume_weight(name)
-            product['product_type'] = self.detect_product_type(name)
+            product['price'] = extract_price_from_title(name)
+            product['volume_weight'] = extract_volume_weight(name)
+            product['product_type'] = detect_product_type(name)
             
             # Extract image
-            img_selectors = [
-                'img.motion-reduce',
-                '.card__media img',
-                'img[src*="cdn.shopify"]',
-                'img',
-            ]
-            
-            for selector in img_selectors:
-                img_elem = product_element.select_one(selector)
-                if img_elem:
+            for selector in self._IMG_SELECTORS:
+                img_elem = _select_one(product_element, selector)
+                if img_elem is not None:
                     img_url = img_elem.get('src') or img_elem.get('data-src')
                     if not img_url:
                         srcset = img_elem.get('srcset')
@@ -336,9 +583,8 @@ class Product_Scraper:
                         break
             
             
-            link_elem = product_element.select_one('a[href*="/products/"]')
-            if link_elem:
-                product['url'] = urljoin(self.BASE_URL, link_elem.get('href'))
+            if product_url is not None:
+                product['url'] = product_url
             
             return product
             
@@ -346,113 +592,193 @@ class Product_Scraper:
             logger.error(f"Error extracting product: {e}")
             return None
     
-    def scrape_category(self, category_url: str, max_products: int = 50) -> List[Dict]:
-        """Scrape products from a category"""
-        products = []
-        page = 1
+    def _page_url(self, category_url: str, page: int) -> str:
+        # Build page URL - if category_url is empty, use BASE_URL directly
+        if category_url:
+            if '?' in category_url:
+                return f"{self.BASE_URL}{category_url}&page={page}"
+            return f"{self.BASE_URL}{category_url}?page={page}"
+        # Use BASE_URL directly when no category_url provided
+        return f"{self.BASE_URL}?page={page}"
+    
+    def _find_product_elements(self, soup: lxml_html.HtmlElement, page: int) -> list:
+        """Product elements on a listing page, trying selectors from most to least specific"""
+        product_elements = []
+        selected_selector = None
         
-        while len(products) < max_products:
-            # Build page URL - if category_url is empty, use BASE_URL directly
-            if category_url:
-                if '?' in category_url:
-                    url = f"{self.BASE_URL}{category_url}&page={page}"
-                else:
-                    url = f"{self.BASE_URL}{category_url}?page={page}"
-            else:
-                # Use BASE_URL directly when no category_url provided
-                url = f"{self.BASE_URL}?page={page}"
-            
-            soup = self.fetch_page(url)
-            if not soup:
+        for selector, desc in self._PRODUCT_SELECTORS:
+            test_elements = _select(soup, selector)
+            logger.debug("Testing '%s' (%s): %d elements", desc, selector, len(test_elements))
+            
+            if 'article' in selector and 2 <= len(test_elements) <= 1000:
+                product_elements = test_elements
+                selected_selector = (selector, desc)
+                logger.info(f"✓ Using {len(test_elements)} {desc}")
                 break
             
             
-            
-           
-            product_selectors = [
-                ('article[class*="text-gray"]', 'article with text-gray class'),  
-                ('article', 'all article tags'),  
-                ('div[class*="product-card"]', 'product-card divs'),
-                ('.grid-item', 'grid-item class'),
-                ('div[class*="col"]', 'column divs'),
-                ('a.full-unstyled-link', 'full-unstyled-link anchors'),
-            ]
-            product_elements = []
-            selected_selector = None
-            
-            for selector, desc in product_selectors:
-                test_elements = soup.select(selector)
-                logger.debug(f"Testing '{desc}' ({selector}): {len(test_elements)} elements")
-                
-                if 'article' in selector and 2 <= len(test_elements) <= 1000:
-                    product_elements = test_elements
+            if len(test_elements) > 0:
+                valid_elements = []
+                for elem in test_elements:
+                    text = _probe_text(elem)
+                    
+                    if len(text) > 50 or _PROBE_RE.search(text):
+                        valid_elements.append(elem)
+
+                if len(valid_elements) >= 2:  
+                    product_elements = valid_elements
                     selected_selector = (selector, desc)
-                    logger.info(f"✓ Using {len(test_elements)} {desc}")
+                    logger.info(f"✓ Found {len(valid_elements)} products with: {desc}")
+                    break
+        
+        if not product_elements:
+            logger.warning(f"No products found on page {page}")
+            logger.info("📝 Hint: Website structure may have changed. Check HTML manually.")
+            return []
+        
+        logger.info(f"Using selector: {selected_selector[1]} ({selected_selector[0]})")
+        return product_elements
+    
+    async def iter_category_async(self, session: aiohttp.ClientSession, sem: asyncio.Semaphore,
+                                  category_url: str, max_products: int = 50,
+                                  seen: Optional[set] = None) -> AsyncIterator[Dict]:
+        """
+        Yield products from a category as each listing page is scraped, a batch of pages at a time
+        
+        seen holds hashes of product URLs (lower-cased names when there is no
+        link) already scraped; those elements are skipped before extraction or
+        a detail-page fetch, and newly yielded products are added to it
+        """
+        count = 0
+        page = 1
+        done = False
+        
+        while not done and count < max_products and page <= 100:
+            batch = range(page, min(page + self.http_concurrency, 101))
+            soups = await asyncio.gather(*(
+                self._afetch_page(session, sem, self._page_url(category_url, page_no))
+                for page_no in batch
+            ))
+            
+            for page_no, soup in zip(batch, soups):
+                if soup is None:
+                    done = True
                     break
                 
+                product_elements = self._find_product_elements(soup, page_no)
+                if not product_elements:
+                    done = True
+                    break
                 
-                if len(test_elements) > 0:
-                    valid_elements = []
-                    for elem in test_elements:
-                        text = elem.get_text(strip=True)
-                        
-                        if any(x in text.lower() for x in ['£', 'ml', 'g', 'kg', 'buy', 'basket']) or len(text) > 50:
-                            valid_elements.append(elem)
-
-                    if len(valid_elements) >= 2:  
-                        product_elements = valid_elements
-                        selected_selector = (selector, desc)
-                        logger.info(f"✓ Found {len(valid_elements)} products with: {desc}")
+                page_products = []
+                duplicates = 0
+                for elem in product_elements:
+                    if count + len(page_products) >= max_products:
                         break
-            
-            if not product_elements:
-                logger.warning(f"No products found on page {page}")
-                logger.info("📝 Hint: Website structure may have changed. Check HTML manually.")
-                break
-            
-            logger.info(f"Using selector: {selected_selector[1]} ({selected_selector[0]})")
-            
-            new_count = 0
-            for elem in product_elements:
-                if len(products) >= max_products:
-                    break
+                    
+                    product_url = self._product_url(elem)
+                    if seen is not None and product_url and hash(product_url) in seen:
+                        duplicates += 1
+                        continue
+                    
+                    product_data = self._extract_product_data(elem, product_url)
+                    if not product_data or not product_data.get('name'):
+                        continue
+                    
+                    if seen is not None:
+                        key_hash = hash(product_url or product_data['name'].lower().strip())
+                        if key_hash in seen:
+                            duplicates += 1
+                            continue
+                        seen.add(key_hash)
+                    page_products.append(product_data)
                 
-                product_data = self.extract_product_data(elem)
+                details = await asyncio.gather(*(
+                    self._aextract_product_page_details(session, sem, product_data.get("url"))
+                    for product_data in page_products
+                ))
+                for product_data, product_details in zip(page_products, details):
+                    product_data.update(product_details)
+                    count += 1
+                    logger.info(f"  ✓ {product_data['name'][:50]}...")
+                    yield product_data
                 
-                if len(products) < max_products and product_data and product_data.get("url"):
-                    self.random_delay()
-                    details = self.extract_product_page_details(product_data["url"])
-                    product_data.update(details)
-
+                logger.info(f"Page {page_no}: Added {len(page_products)} products (Total: {count})")
                 
-
-                if product_data and product_data.get('name'):
-        # Final check before adding to ensure we don't exceed max_products
-                    if len(products) < max_products:
-                        products.append(product_data)
-                        new_count += 1
-                        logger.info(f"  ✓ {product_data['name'][:50]}...")
-                        
-            logger.info(f"Page {page}: Added {new_count} products (Total: {len(products)})")
-            
-            if len(products) >= max_products:
-                break
-            
-            if new_count == 0:
-                break
-            
-            page += 1
-            self.random_delay()
+                # A page of only already-seen products still means more pages may follow
+                if count >= max_products or not (page_products or duplicates):
+                    done = True
+                    break
             
-            if page > 100:  
-                break
-        
-        return products
+            page = batch[-1] + 1
+            if not done:
+                await asyncio.sleep(random.uniform(*self.delay_range))
+    
+    async def scrape_category_async(self, session: aiohttp.ClientSession, sem: asyncio.Semaphore,
+                                    category_url: str, max_products: int = 50) -> List[Dict]:
+        """Scrape products from a category"""
+        async with contextlib.aclosing(
+            self.iter_category_async(session, sem, category_url, max_products)
+        ) as products:
+            return [product async for product in products]
     
     def scrape_all(self, target_count: int = 100) -> List[Dict]:
         """Scrape products from all categories"""
-        all_products = []
-        seen_names = set()
+        return asyncio.run(self.scrape_all_async(target_count))
+    
+    async def scrape_all_async(self, target_count: int = 100) -> List[Dict]:
+        """Scrape products from all categories, over HTTP once the browser has cleared Cloudflare"""
+        self.cols = defaultdict(list)
+        self.product_count = 0
+        
+        async with contextlib.aclosing(self._iter_all_async(target_count)) as products:
+            async for product in products:
+                self._add_product(product)
+        
+        logger.info(f"\n✅ Scraping complete! Total: {self.product_count} products")
+        return self.all_products
+    
+    @property
+    def all_products(self) -> List[Dict]:
+        """Scraped products as a list of row dicts"""
+        return list(self.iter_products())
+    
+    def iter_products(self):
+        """Yield scraped products as row dicts, built lazily from the columns"""
+        keys = list(self.cols)
+        for values in zip(*self.cols.values()):
+            yield {key: value for key, value in zip(keys, values) if value is not _MISSING}
+    
+    def _add_product(self, product_data: Dict):
+        """Append one product to the column store"""
+        for key in product_data:
+            if key not in self.cols:
+                # Backfill a field first seen on this product
+                self.cols[key].extend([_MISSING] * self.product_count)
+        for key, column in self.cols.items():
+            column.append(product_data.get(key, _MISSING))
+        self.product_count += 1
+    
+    async def scrape_all_streaming(self, target_count: int, out_path: str) -> AsyncIterator[Dict]:
+        """Yield products from all categories, appending each to out_path as a JSON line as it arrives"""
+        Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+        count = 0
+        
+        with open(out_path, 'wb') as f:
+            async with contextlib.aclosing(self._iter_all_async(target_count)) as products:
+                async for product in products:
+                    f.write(orjson.dumps(product))
+                    f.write(b'\n')
+                    count += 1
+                    yield product
+        
+        logger.info(f"\n✅ Scraping complete! Streamed {count} products to {out_path}")
+    
+    async def _iter_all_async(self, target_count: int) -> AsyncIterator[Dict]:
+        """Browser and HTTP session setup plus dedupe, shared by scrape_all_async and scrape_all_streaming"""
+        # Hashes of product URLs (or lower-cased names), not the keys themselves
+        seen: set[int] = set()
+        count = 0
         
         try:
             # Start browser
@@ -461,63 +787,60 @@ class Product_Scraper:
             
             logger.info("🏠 Visiting homepage first...")
             self.fetch_page(self.BASE_URL)
-            self.random_delay()
-            
-            # Using BASE_URL directly instead of iterating through CATEGORY_URLS
-            # for category_url in self.CATEGORY_URLS:
-            #     if len(all_products) >= target_count:
-            #         break
-            #     
-            #     logger.info(f"\n📁 Category: {category_url}")
-            #     logger.info("-" * 40)
-            #     
-            #     remaining = target_count - len(all_products)
-            #     products = self.scrape_category(category_url, max_products=remaining + 20)
-            #     
-            #     for product in products:
-            #         name_key = product.get('name', '').lower().strip()
-            #         if name_key and name_key not in seen_names:
-            #             seen_names.add(name_key)
-            #             all_products.append(product)
-            #         
-            #         if len(all_products) >= target_count:
-            #             break
-            #     
-            #     logger.info(f"Total so far: {len(all_products)}")
-            #     self.random_delay()
-            
-            # Scrape from BASE_URL directly
-            logger.info(f"\n📁 Scraping from: {self.BASE_URL}")
-            logger.info("-" * 40)
-            
-            products = self.scrape_category("", max_products=target_count + 0)
-            
-            for product in products:
-                name_key = product.get('name', '').lower().strip()
-                if name_key and name_key not in seen_names:
-                    seen_names.add(name_key)
-                    all_products.append(product)
+            self._browser_executor = ThreadPoolExecutor(max_workers=self.pool_size)
+            sem = asyncio.Semaphore(self.http_concurrency)
+            await asyncio.sleep(random.uniform(*self.delay_range))
+            
+            async with aiohttp.ClientSession(
+                headers=self._http_headers(),
+                cookies=self._browser_cookies(),
+                timeout=aiohttp.ClientTimeout(total=60),
+            ) as session:
+                # Using BASE_URL directly instead of iterating through CATEGORY_URLS
+                # for category_url in self.CATEGORY_URLS:
+                #     if count >= target_count:
+                #         break
+                #     
+                #     logger.info(f"\n📁 Category: {category_url}")
+                #     logger.info("-" * 40)
+                #     
+                #     remaining = target_count - count
+                #     async for product in self.iter_category_async(session, sem, category_url,
+                #                                                   max_products=remaining, seen=seen):
+                #         count += 1
+                #         yield product
+                #     
+                #     logger.info(f"Total so far: {count}")
+                #     await asyncio.sleep(random.uniform(*self.delay_range))
                 
-                if len(all_products) >= target_count:
-                    break
+                # Scrape from BASE_URL directly
+                logger.info(f"\n📁 Scraping from: {self.BASE_URL}")
+                logger.info("-" * 40)
+                
+                async with contextlib.aclosing(
+                    self.iter_category_async(session, sem, "", max_products=target_count, seen=seen)
+                ) as products:
+                    async for product in products:
+                        count += 1
+                        yield product
             
-            logger.info(f"Total scraped: {len(all_products)}")
+            logger.info(f"Total scraped: {count}")
             
         except Exception as e:
             logger.error(f"Error during scraping: {e}")
         
         finally:
+            if self._browser_executor is not None:
+                self._browser_executor.shutdown(wait=True)
+                self._browser_executor = None
             self.close_browser()
-        
-        logger.info(f"\n✅ Scraping complete! Total: {len(all_products)} products")
-        return all_products
     
     def save_to_json(self, products: List[Dict], filepath: str):
         """Save products to JSON file"""
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(products, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(products, option=_JSON_OPTIONS))
         
         logger.info(f"💾 Saved {len(products)} products to {filepath}")
 
@@ -534,7 +857,7 @@ def main():
     )
     
   
-    products = scraper.scrape_all(target_count=100)
+    products = asyncio.run(scraper.scrape_all_async(target_count=100))
     
     if products:
         
@@ -5,11 +5,16 @@ Orchestrates the complete pipeline:
 Scrapers (Simple) → Raw JSON Files → Central Cleaner (Smart) → Master JSON (Standardized)
 """
 
+import os
 import sys
-import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
+
+import orjson
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -18,6 +23,47 @@ from cleaner.cleaner_intergated import IntegratedProductCleaner
 from bestwayScraper import BestwayScraper
 from laxmiScraper import LakshmiGroceryScraper
 
+try:
+    from tqdm import tqdm
+except ImportError:  # Progress bar is optional
+    tqdm = None
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+# Per-process cleaner for ScraperRunner.merge_and_standardize
+_worker_cleaner: Optional[IntegratedProductCleaner] = None
+
+
+def _init_worker(brands_file: Optional[str]):
+    """Build the worker's cleaner once, so compiled state is reused"""
+    global _worker_cleaner
+    _worker_cleaner = IntegratedProductCleaner(brands_file)
+    # The parent process owns the brands file
+    _worker_cleaner.brand_detector.auto_save = False
+
+
+def _load_raw_products(file_path: str):
+    """Products from a JSON file, or from a JSON Lines file one line at a time"""
+    if file_path.endswith('.jsonl'):
+        with open(file_path, 'rb') as f:
+            return [orjson.loads(line) for line in f if line.strip()]
+    return orjson.loads(Path(file_path).read_bytes())
+
+
+def _clean_one(raw_product: dict, source_name: str, source_url: str):
+    """Clean, tag and schema-enforce one raw product in a worker; returns (cleaned, error)"""
+    try:
+        cleaned = _worker_cleaner.clean_and_normalize_product(raw_product)
+        cleaned = _worker_cleaner.add_source_metadata(
+            cleaned,
+            source_name=source_name,
+            source_url=source_url
+        )
+        return _worker_cleaner.enforce_schema(cleaned), None
+    except Exception as e:
+        return None, str(e)
+
 
 class ScraperRunner:
     """Orchestrates the scraping and cleaning pipeline"""
@@ -73,7 +119,8 @@ class ScraperRunner:
         Merge products from multiple sources and standardize to master schema
         
         Args:
-            source_configs: List of dicts with 'file', 'name', 'url' keys
+            source_configs: List of dicts with 'file', 'name', 'url' keys;
+                'file' may be .json or .jsonl
         
         Returns:
             List of standardized products
@@ -95,8 +142,7 @@ class ScraperRunner:
             
             print(f"\n📥 Processing {source_name}...")
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    raw_products = json.load(f)
+                raw_products = _load_raw_products(file_path)
                 
                 # Ensure it's a list
                 if isinstance(raw_products, dict):
@@ -106,32 +152,30 @@ class ScraperRunner:
                 
                 print(f"   Found {len(raw_products)} raw products")
                 
-                # Process through integrated cleaner
+                # Process through integrated cleaner, one worker per core
                 cleaned_count = 0
-                for i, raw_product in enumerate(raw_products, 1):
-                    try:
-                        # Clean and normalize
-                        cleaned = self.cleaner.clean_and_normalize_product(raw_product)
-                        
-                        # Add source metadata
-                        cleaned = self.cleaner.add_source_metadata(
-                            cleaned,
-                            source_name=source_name,
-                            source_url=source_url
-                        )
-                        
-                        # Enforce schema
-                        cleaned = self.cleaner.enforce_schema(cleaned)
+                with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                         initializer=_init_worker,
+                                         initargs=(self.cleaner.brands_file,)) as executor:
+                    results = executor.map(_clean_one, raw_products,
+                                           repeat(source_name), repeat(source_url),
+                                           chunksize=64)
+                    if tqdm is not None:
+                        results = tqdm(results, total=len(raw_products), desc=f"   {source_name}")
+                    
+                    for i, (raw_product, (cleaned, error)) in enumerate(zip(raw_products, results), 1):
+                        if error:
+                            print(f"   ⚠️  Error on product {i}: {error}")
+                            continue
                         
                         all_cleaned_products.append(cleaned)
                         cleaned_count += 1
                         
-                        if i % 20 == 0:
-                            print(f"   Processed {i}/{len(raw_products)}...")
-                    
-                    except Exception as e:
-                        print(f"   ⚠️  Error on product {i}: {e}")
-                        continue
+                        # Workers don't save brands; learn them here so the brands file has one writer
+                        brand = self.cleaner.confirmed_brand(raw_product)
+                        if brand:
+                            original_name = raw_product.get('name') or raw_product.get('Product Name', '')
+                            self.cleaner.brand_detector.learn_brand(original_name, brand)
                 
                 print(f"   ✅ Cleaned {cleaned_count}/{len(raw_products)} products")
             
@@ -148,8 +192,8 @@ class ScraperRunner:
         
         output_path = self.output_dir / filename
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(products, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(products, option=_JSON_OPTIONS))
         
         print(f"✅ Master JSON saved: {output_path}")
         return str(output_path)